@@ -6,7 +6,7 @@ UPDATED: First run trailer and level transition videos
 import os
 import sys
 from PySide6.QtWidgets import QMainWindow, QStackedWidget
-from PySide6.QtCore import Qt, QTimer
+from PySide6.QtCore import Qt, QTimer, Slot
 from PySide6.QtGui import QIcon
 from app.game_manager import GameManager
 from app.state_manager import StateManager, GameState
@@ -58,10 +58,11 @@ class AppWindow(QMainWindow):
         # Connect state changes
         self.state_manager.state_changed.connect(self.on_state_changed)
         
-        # Connect achievement notifications
+        # Connect achievement notifications (queued so popups never run
+        # inside AchievementManager.unlock)
         if hasattr(self.game_manager, 'achievement_manager'):
             self.game_manager.achievement_manager.achievement_unlocked.connect(
-                self.show_achievement_notification
+                self.show_achievement_notification, Qt.QueuedConnection
             )
         
         # Set initial state
@@ -246,7 +247,7 @@ class AppWindow(QMainWindow):
     def closeEvent(self, event):
         """Handle window close - save settings"""
         print("AppWindow: Closing, saving settings...")
-        self.game_manager.settings_manager.save_settings()
+        self.game_manager.settings_manager.flush()
         event.accept()
     
     def show_first_run_trailer(self):
@@ -295,6 +296,7 @@ class AppWindow(QMainWindow):
         video_player.video_skipped.connect(on_video_skip)
         video_player.play_video(flying_path)
     
+    @Slot(str, str, str)
     def show_achievement_notification(self, achievement_id, name, description):
         """Show achievement unlock notification"""
         if hasattr(self.game_manager, 'achievement_manager'):
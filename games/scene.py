@@ -582,7 +582,10 @@ class GameScene(QWidget):
             self.chain.draw(painter)
         if self.shooter:
             self.shooter.draw(painter)
-        self.hud.draw(painter)
+        # HUD hanya menggambar bagian yang terkena repaint (rect dalam koordinat logis)
+        inverse, invertible = painter.transform().inverted()
+        hud_rect = inverse.mapRect(QRectF(event.rect())) if invertible else None
+        self.hud.draw(painter, hud_rect)
         
         # CHEAT: Show FPS
         if cheat_sys and cheat_sys.show_fps:
@@ -630,14 +633,27 @@ class GameScene(QWidget):
         painter.setFont(QFont("Arial", 48, QFont.Bold))
         painter.drawText(rect, Qt.AlignCenter, "GAME OVER")
         
+    def _request_scaled_wallpaper(self, size):
+        """Get the scaled wallpaper, scaling a cache miss off the GUI thread"""
+        # Until the result arrives the gradient background is drawn instead
+        path = self.current_wallpaper_path
+        
+        def on_scaled(pixmap):
+            # Ignore results for a wallpaper/size that is no longer current
+            if path == self.current_wallpaper_path and size == self.last_wallpaper_size:
+                self.cached_wallpaper = pixmap
+                self.update()
+        
+        return self.image_cache.get_scaled_pixmap(
+            path, size, keep_aspect_ratio=True, callback=on_scaled
+        )
+    
     def _draw_background_scaled(self, painter, rect):
         if self.current_wallpaper and not self.current_wallpaper.isNull():
             current_size = QSize(int(rect.width()), int(rect.height()))
-            if self.last_wallpaper_size != current_size or not self.cached_wallpaper:
-                self.cached_wallpaper = self.image_cache.get_scaled_pixmap(
-                    self.current_wallpaper_path, current_size, keep_aspect_ratio=True
-                )
+            if self.last_wallpaper_size != current_size:
                 self.last_wallpaper_size = current_size
+                self.cached_wallpaper = self._request_scaled_wallpaper(current_size)
             
             if self.cached_wallpaper and not self.cached_wallpaper.isNull():
                 x = (rect.width() - self.cached_wallpaper.width()) / 2
@@ -3,19 +3,58 @@ Achievement system for Ancient Tiger
 Complete achievement tracking and persistence
 """
 
-import json
 import os
 import sys
+import struct
+import functools
 from pathlib import Path
 from datetime import datetime
+import orjson
 from PySide6.QtCore import QObject, Signal
 
+# Binary store layout (achievements.bin):
+#   header     - magic, format version, number of achievement slots
+#   stats      - fixed record, one field per entry in STATS_LAYOUT
+#   timestamps - one float64 per achievement (0.0 = locked), in ACHIEVEMENTS order
+STORE_MAGIC = b"ATAC"
+STORE_VERSION = 1
+STATS_LAYOUT = (
+    ("orbs_destroyed", "q"),
+    ("levels_completed", "q"),
+    ("max_level_reached", "q"),
+    ("max_combo", "q"),
+    ("total_playtime", "d"),
+    ("continuous_playtime", "d"),
+    ("shots_fired", "q"),
+    ("shots_hit", "q"),
+    ("consecutive_hits", "q"),
+    ("danger_time", "d"),
+    ("black_hole_enters", "q"),
+    ("story_viewed", "?"),
+    ("story_completed", "?"),
+    ("game_overs", "q"),
+    ("idle_time", "d"),
+)
+_HEADER = struct.Struct("<4sHH")
+_STATS = struct.Struct("<" + "".join(fmt for _, fmt in STATS_LAYOUT))
+
+
+def _group_by_category(records):
+    """Group (id, record) pairs into {category: {id: record}}"""
+    groups = {}
+    for aid, data in records:
+        groups.setdefault(data['category'], {})[aid] = data
+    return groups
+
 class AchievementManager(QObject):
     """Manages achievement unlocks and tracking"""
     
     achievement_unlocked = Signal(str, str, str)  # id, name, description
+    progress_changed = Signal(int, int)  # unlocked, total
     
-    # Achievement definitions with categories
+    # Achievement definitions with categories.
+    # NOTE: the binary store indexes achievements by position, so new
+    # entries must be appended at the end.
     ACHIEVEMENTS = {
         # I. PROGRESS & EXPLORATION (Beginner-Friendly)
         "first_launch": {
@@ -282,14 +321,28 @@ class AchievementManager(QObject):
         }
     }
     
+    # Lookup tables built once at import
+    _ACH_LIST = tuple(ACHIEVEMENTS.items())
+    _ACH_INDEX = {aid: i for i, aid in enumerate(ACHIEVEMENTS)}
+    _BY_CATEGORY = _group_by_category(_ACH_LIST)
+    _CATEGORIES = tuple(sorted(_BY_CATEGORY))
+    _GROUPED = tuple(zip(_CATEGORIES, map(_BY_CATEGORY.get, _CATEGORIES)))
+    
+    # Save directory already created by an earlier instance
+    _ensured_dir = None
+    
     def __init__(self):
         super().__init__()
         self.save_dir = self._get_save_directory()
-        self.achievement_file = self.save_dir / "achievements.json"
+        self.achievement_file = self.save_dir / "achievements.bin"
+        self.legacy_file = self.save_dir / "achievements.json"
         
-        # Tracking data
-        self.unlocked = {}
-        self.stats = {
+        # Tracking data, read from disk on first access (see _ensure_loaded)
+        self._loaded = False
+        self._unlocked = {}
+        self._unlocked_set = set()  # mirror of self.unlocked keys
+        self._unlocked_count = 0  # unlocked ids, excluding "complete_all"
+        self._stats = {
             "orbs_destroyed": 0,
             "levels_completed": 0,
             "max_level_reached": 0,
@@ -307,16 +360,35 @@ class AchievementManager(QObject):
             "idle_time": 0
         }
         
-        # Ensure directory exists
-        try:
-            self.save_dir.mkdir(parents=True, exist_ok=True)
-        except Exception as e:
-            print(f"AchievementManager: Error creating directory {e}")
-        
-        self.load_achievements()
+        # Ensure directory exists (once per process and directory)
+        if AchievementManager._ensured_dir != self.save_dir:
+            try:
+                self.save_dir.mkdir(parents=True, exist_ok=True)
+                AchievementManager._ensured_dir = self.save_dir
+            except Exception as e:
+                print(f"AchievementManager: Error creating directory {e}")
+    
+    @property
+    def unlocked(self):
+        """Unlocked achievements as {id: {'unlocked_at', 'timestamp'}}"""
+        self._ensure_loaded()
+        return self._unlocked
     
-    def _get_save_directory(self):
-        """Get platform-specific save directory"""
+    @property
+    def stats(self):
+        """Tracked gameplay counters"""
+        self._ensure_loaded()
+        return self._stats
+    
+    def _ensure_loaded(self):
+        """Load the store the first time achievement data is needed"""
+        if not self._loaded:
+            self.load_achievements()
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def _get_save_directory():
+        """Get platform-specific save directory (resolved once per process)"""
         app_name = "MacanAncient"
         
         if os.name == 'nt':
@@ -339,84 +411,166 @@ class AchievementManager(QObject):
         return home / ".local" / "share" / app_name
     
     def load_achievements(self):
-        """Load achievements from JSON"""
+        """Load achievements from the binary store (or legacy JSON)"""
+        self._loaded = True
         try:
             if self.achievement_file.exists():
-                with open(self.achievement_file, 'r') as f:
-                    data = json.load(f)
-                    self.unlocked = data.get('unlocked', {})
-                    self.stats = data.get('stats', self.stats)
-                    print(f"AchievementManager: Loaded {len(self.unlocked)} achievements")
+                self._unpack(self.achievement_file.read_bytes())
+                print(f"AchievementManager: Loaded {len(self._unlocked)} achievements")
+            elif self.legacy_file.exists():
+                # One-time migration from the old achievements.json
+                data = orjson.loads(self.legacy_file.read_bytes())
+                self._unlocked = {
+                    aid: self._migrate_unlock(info)
+                    for aid, info in data.get('unlocked', {}).items()
+                }
+                self._stats.update(data.get('stats', {}))
+                print(f"AchievementManager: Migrated {len(self._unlocked)} achievements")
+                self.save_achievements()
         except Exception as e:
             print(f"AchievementManager: Error loading - {e}")
+        
+        self._sync_unlocked()
+    
+    @staticmethod
+    def _migrate_unlock(info):
+        """Legacy unlock entry with a 'timestamp' (from 'unlocked_at', else now)"""
+        info = dict(info) if isinstance(info, dict) else {}
+        if not isinstance(info.get('timestamp'), (int, float)):
+            try:
+                when = datetime.fromisoformat(info['unlocked_at'])
+            except (KeyError, TypeError, ValueError):
+                when = datetime.now()
+            info['unlocked_at'] = when.isoformat()
+            info['timestamp'] = when.timestamp()
+        return info
+    
+    def _sync_unlocked(self):
+        """Rebuild the unlock set and counter after self.unlocked is replaced"""
+        self._unlocked_set = set(self._unlocked)
+        self._unlocked_count = sum(
+            1 for aid in self._unlocked
+            if aid != "complete_all" and aid in self._ACH_INDEX
+        )
+    
+    def reset_achievements(self):
+        """Lock every achievement again and persist"""
+        self._ensure_loaded()  # keep the stored stats
+        self._unlocked = {}
+        self._unlocked_set.clear()
+        self._unlocked_count = 0
+        self.save_achievements()
+        self.progress_changed.emit(0, len(self._ACH_LIST))
     
     def save_achievements(self):
-        """Save achievements to JSON"""
+        """Save achievements to the binary store (atomic replace)"""
+        tmp_file = self.achievement_file.with_suffix('.bin.tmp')
+        data = self._pack()  # Outside the try: a packing bug should raise, not be logged as an I/O error
         try:
-            data = {
-                'unlocked': self.unlocked,
-                'stats': self.stats
-            }
-            with open(self.achievement_file, 'w') as f:
-                json.dump(data, f, indent=4)
-        except Exception as e:
+            with open(tmp_file, 'wb') as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, self.achievement_file)
+        except OSError as e:
             print(f"AchievementManager: Error saving - {e}")
     
+    def _pack(self):
+        """Serialize stats and unlock timestamps into the binary layout"""
+        count = len(self._ACH_LIST)
+        header = _HEADER.pack(STORE_MAGIC, STORE_VERSION, count)
+        stats = _STATS.pack(*(self.stats[name] for name, _ in STATS_LAYOUT))
+        
+        timestamps = [0.0] * count
+        for aid, info in self.unlocked.items():
+            index = self._ACH_INDEX.get(aid)
+            if index is not None:
+                timestamps[index] = info['timestamp']
+        
+        return header + stats + struct.pack(f"<{count}d", *timestamps)
+    
+    def _unpack(self, data):
+        """Restore stats and unlocks from the binary layout"""
+        magic, version, count = _HEADER.unpack_from(data)
+        if magic != STORE_MAGIC or version != STORE_VERSION:
+            raise ValueError("unknown achievement store format")
+        
+        values = _STATS.unpack_from(data, _HEADER.size)
+        self._stats.update(zip((name for name, _ in STATS_LAYOUT), values))
+        
+        records = self._ACH_LIST[:count]
+        timestamps = struct.unpack_from(f"<{len(records)}d", data, _HEADER.size + _STATS.size)
+        self._unlocked = {
+            aid: {
+                'unlocked_at': datetime.fromtimestamp(ts).isoformat(),
+                'timestamp': ts
+            }
+            for (aid, _), ts in zip(records, timestamps) if ts
+        }
+    
     def unlock(self, achievement_id):
         """Unlock an achievement"""
-        if achievement_id not in self.ACHIEVEMENTS:
+        if achievement_id not in self._ACH_INDEX:
             return False
         
-        if achievement_id in self.unlocked:
+        self._ensure_loaded()
+        if achievement_id in self._unlocked_set:
             return False  # Already unlocked
         
         # Unlock it
-        self.unlocked[achievement_id] = {
-            'unlocked_at': datetime.now().isoformat(),
-            'timestamp': datetime.now().timestamp()
+        now = datetime.now()
+        self._unlocked[achievement_id] = {
+            'unlocked_at': now.isoformat(),
+            'timestamp': now.timestamp()
         }
+        self._unlocked_set.add(achievement_id)
+        if achievement_id != "complete_all":
+            self._unlocked_count += 1
+        
+        # Persist before notifying so a failing UI slot can't lose the unlock
+        self.save_achievements()
         
         achievement = self.ACHIEVEMENTS[achievement_id]
         print(f"🏆 ACHIEVEMENT UNLOCKED: {achievement['name']}")
         
-        # Emit signal
+        # Emit signal (consumers should connect with Qt.QueuedConnection)
         self.achievement_unlocked.emit(
             achievement_id,
             achievement['name'],
             achievement['description']
         )
+        self.progress_changed.emit(len(self._unlocked_set), len(self._ACH_LIST))
         
         # Check if all achievements unlocked
         self.check_complete_all()
-        
-        self.save_achievements()
         return True
     
     def check_complete_all(self):
         """Check if all achievements are unlocked"""
-        total = len(self.ACHIEVEMENTS) - 1  # Exclude "complete_all" itself
-        unlocked_count = len([a for a in self.unlocked if a != "complete_all"])
-        
-        if unlocked_count >= total:
+        total = len(self._ACH_LIST) - 1  # Exclude "complete_all" itself
+        if self._unlocked_count >= total:
             self.unlock("complete_all")
     
     def is_unlocked(self, achievement_id):
         """Check if achievement is unlocked"""
-        return achievement_id in self.unlocked
+        self._ensure_loaded()
+        return achievement_id in self._unlocked_set
     
     def get_progress(self):
         """Get overall progress"""
-        total = len(self.ACHIEVEMENTS)
-        unlocked = len(self.unlocked)
+        self._ensure_loaded()
+        total = len(self._ACH_LIST)
+        unlocked = len(self._unlocked_set)
         return unlocked, total, (unlocked / total) * 100
     
     def get_by_category(self, category):
-        """Get achievements by category"""
-        return {
-            aid: data for aid, data in self.ACHIEVEMENTS.items()
-            if data['category'] == category
-        }
+        """Get achievements by category (shared, do not mutate)"""
+        return self._BY_CATEGORY.get(category, {})
     
     def get_categories(self):
         """Get all unique categories"""
-        return sorted(set(a['category'] for a in self.ACHIEVEMENTS.values()))
\ No newline at end of file
+        return self._CATEGORIES
+    
+    def get_grouped(self):
+        """Get (category, achievements) pairs in category order (shared, do not mutate)"""
+        return self._GROUPED
\ No newline at end of file
@@ -2,159 +2,254 @@
 Achievement tracker - monitors game events and triggers achievements
 """
 
+import math
+
+# Achievement thresholds
+ORB_BREAKER_ORBS = 50
+ORB_HUNTER_ORBS = 250
+ORB_ANNIHILATOR_ORBS = 1000
+BEYOND_VOID_LEVEL = 10
+EDGE_COSMOS_LEVEL = 25
+DIMENSION_MASTER_LEVEL = 50
+PERFECT_AIM_HITS = 10
+COMBO_APPRENTICE_COMBO = 5
+COMBO_MASTER_COMBO = 10
+NO_PANIC_SECONDS = 5
+CALM_PRESSURE_SECONDS = 10
+VOID_STARES_ENTERS = 10
+ENDLESS_TRAVELER_SECONDS = 1800  # 30 minutes
+COSMIC_JOURNEY_SECONDS = 3600  # 1 hour
+NO_ESCAPE_SECONDS = 900  # 15 minutes
+ANCIENT_ALLIANCE_SECONDS = 1800  # 30 minutes
+TIGER_WATCHES_SECONDS = 10
+
+# Stat values (seconds) at which the per-frame timers can unlock something
+PLAYTIME_MILESTONES = (ENDLESS_TRAVELER_SECONDS, COSMIC_JOURNEY_SECONDS)
+CONTINUOUS_MILESTONES = (NO_ESCAPE_SECONDS, ANCIENT_ALLIANCE_SECONDS)
+IDLE_MILESTONES = (TIGER_WATCHES_SECONDS,)
+
+# (stat, threshold, achievement id) - unlocked once stats[stat] >= threshold
+_RULES = (
+    # Progress & Exploration
+    ('orbs_destroyed', ORB_BREAKER_ORBS, 'orb_breaker'),
+    ('orbs_destroyed', ORB_HUNTER_ORBS, 'orb_hunter'),
+    ('orbs_destroyed', ORB_ANNIHILATOR_ORBS, 'orb_annihilator'),
+    ('levels_completed', 1, 'first_escape'),
+    ('max_level_reached', BEYOND_VOID_LEVEL, 'beyond_void'),
+    ('max_level_reached', EDGE_COSMOS_LEVEL, 'edge_cosmos'),
+    ('max_level_reached', DIMENSION_MASTER_LEVEL, 'dimension_master'),
+    
+    # Skill & Combat
+    ('consecutive_hits', PERFECT_AIM_HITS, 'perfect_aim'),
+    ('max_combo', COMBO_APPRENTICE_COMBO, 'combo_apprentice'),
+    ('max_combo', COMBO_MASTER_COMBO, 'combo_master'),
+    ('danger_time', NO_PANIC_SECONDS, 'no_panic'),
+    ('danger_time', CALM_PRESSURE_SECONDS, 'calm_pressure'),
+    
+    # Black Hole & Physics
+    ('black_hole_enters', 1, 'gravity_victim'),
+    ('black_hole_enters', VOID_STARES_ENTERS, 'void_stares'),
+    
+    # Lore & Story
+    ('story_viewed', True, 'ancient_awakens'),
+    ('story_completed', True, 'temple_echoes'),
+    
+    # Endurance & Dedication
+    ('total_playtime', ENDLESS_TRAVELER_SECONDS, 'endless_traveler'),
+    ('total_playtime', COSMIC_JOURNEY_SECONDS, 'cosmic_journey'),
+    ('continuous_playtime', NO_ESCAPE_SECONDS, 'no_escape'),
+    ('game_overs', 1, 'return_void'),
+    
+    # Secret
+    ('idle_time', TIGER_WATCHES_SECONDS, 'tiger_watches'),
+)
+
+# (achievement id, stats read, predicate over stats) for multi-stat rules
+_COMPOUND_RULES = (
+    ('chosen_tiger', ('story_completed', 'max_level_reached'),
+     lambda s: s['story_completed'] and s['max_level_reached'] >= EDGE_COSMOS_LEVEL),
+    ('balance_keeper', ('story_completed', 'max_level_reached'),
+     lambda s: s['story_completed'] and s['max_level_reached'] >= DIMENSION_MASTER_LEVEL),
+    ('ancient_alliance', ('continuous_playtime', 'game_overs'),
+     lambda s: s['continuous_playtime'] >= ANCIENT_ALLIANCE_SECONDS and s['game_overs'] == 0),
+)
+
+def _index_rules():
+    """Group the rule tables by stat so an event only re-checks its own stats"""
+    simple = {}
+    for stat, threshold, achievement_id in _RULES:
+        simple.setdefault(stat, []).append((threshold, achievement_id))
+    
+    compound = {}
+    for achievement_id, stat_names, condition in _COMPOUND_RULES:
+        for stat in stat_names:
+            compound.setdefault(stat, []).append((achievement_id, condition))
+    
+    return (
+        {stat: tuple(rules) for stat, rules in simple.items()},
+        {stat: tuple(rules) for stat, rules in compound.items()},
+    )
+
+
+_RULES_BY_STAT, _COMPOUND_RULES_BY_STAT = _index_rules()
+
+
+def _next_milestone(value, milestones):
+    """Return the first milestone above value, or inf when all are reached"""
+    for milestone in milestones:
+        if milestone > value:
+            return milestone
+    return math.inf
+
+
 class AchievementTracker:
     """Tracks game events and triggers achievements"""
     
     def __init__(self, achievement_manager):
         self.manager = achievement_manager
         
+        # The first timer update runs check_all and schedules the real
+        # milestones, so constructing the tracker doesn't load the store
+        self._next_playtime_check = 0
+        self._next_continuous_check = 0
+        self._next_idle_check = 0
+        
+        # Stats loaded from disk may already satisfy rules whose stat never
+        # changes again, so the first check evaluates every rule once
+        self._stats_checked = False
+        
+    def _schedule_timer_checks(self):
+        """Recompute when the playtime/idle timers next need a check_all"""
+        stats = self.manager.stats
+        self._next_playtime_check = _next_milestone(
+            stats['total_playtime'], PLAYTIME_MILESTONES)
+        self._next_continuous_check = _next_milestone(
+            stats['continuous_playtime'], CONTINUOUS_MILESTONES)
+        self._next_idle_check = _next_milestone(
+            stats['idle_time'], IDLE_MILESTONES)
+    
     def check_all(self):
         """Check all conditions based on current stats"""
         stats = self.manager.stats
+        unlock = self.manager.unlock
+        self._stats_checked = True
         
-        # Progress & Exploration
-        if stats['orbs_destroyed'] >= 50:
-            self.manager.unlock('orb_breaker')
-        if stats['orbs_destroyed'] >= 250:
-            self.manager.unlock('orb_hunter')
-        if stats['orbs_destroyed'] >= 1000:
-            self.manager.unlock('orb_annihilator')
+        for stat, threshold, achievement_id in _RULES:
+            if stats[stat] >= threshold:
+                unlock(achievement_id)
         
-        if stats['levels_completed'] >= 1:
-            self.manager.unlock('first_escape')
-        if stats['max_level_reached'] >= 10:
-            self.manager.unlock('beyond_void')
-        if stats['max_level_reached'] >= 25:
-            self.manager.unlock('edge_cosmos')
-        if stats['max_level_reached'] >= 50:
-            self.manager.unlock('dimension_master')
-        
-        # Skill & Combat
-        if stats['consecutive_hits'] >= 10:
-            self.manager.unlock('perfect_aim')
-        
-        if stats['max_combo'] >= 5:
-            self.manager.unlock('combo_apprentice')
-        if stats['max_combo'] >= 10:
-            self.manager.unlock('combo_master')
-        
-        if stats['danger_time'] >= 5:
-            self.manager.unlock('no_panic')
-        if stats['danger_time'] >= 10:
-            self.manager.unlock('calm_pressure')
-        
-        # Black Hole & Physics
-        if stats['black_hole_enters'] >= 1:
-            self.manager.unlock('gravity_victim')
-        if stats['black_hole_enters'] >= 10:
-            self.manager.unlock('void_stares')
-        
-        # Lore & Story
-        if stats['story_viewed']:
-            self.manager.unlock('ancient_awakens')
-        if stats['story_completed']:
-            self.manager.unlock('temple_echoes')
-        
-        if stats['story_completed'] and stats['max_level_reached'] >= 25:
-            self.manager.unlock('chosen_tiger')
-        if stats['story_completed'] and stats['max_level_reached'] >= 50:
-            self.manager.unlock('balance_keeper')
-        
-        # Endurance & Dedication
-        if stats['total_playtime'] >= 1800:  # 30 minutes
-            self.manager.unlock('endless_traveler')
-        if stats['total_playtime'] >= 3600:  # 1 hour
-            self.manager.unlock('cosmic_journey')
-        
-        if stats['continuous_playtime'] >= 900:  # 15 minutes
-            self.manager.unlock('no_escape')
-        
-        if stats['game_overs'] >= 1:
-            self.manager.unlock('return_void')
+        for achievement_id, _, condition in _COMPOUND_RULES:
+            if condition(stats):
+                unlock(achievement_id)
+    
+    def _check_stats(self, *stat_names):
+        """Check only the rules that read the given stats"""
+        stats = self.manager.stats
+        unlock = self.manager.unlock
         
-        # Secret
-        if stats['continuous_playtime'] >= 1800 and stats['game_overs'] == 0:
-            self.manager.unlock('ancient_alliance')
+        if not self._stats_checked:
+            self._stats_checked = True
+            stat_names = _RULES_BY_STAT
         
-        if stats['idle_time'] >= 10:
-            self.manager.unlock('tiger_watches')
+        for stat in stat_names:
+            value = stats[stat]
+            for threshold, achievement_id in _RULES_BY_STAT.get(stat, ()):
+                if value >= threshold:
+                    unlock(achievement_id)
+            for achievement_id, condition in _COMPOUND_RULES_BY_STAT.get(stat, ()):
+                if condition(stats):
+                    unlock(achievement_id)
     
     def on_game_start(self):
         """Called when game starts"""
-        self.manager.unlock('first_launch')
-        self.manager.stats['continuous_playtime'] = 0
+        manager = self.manager
+        manager.unlock('first_launch')
+        manager.stats['continuous_playtime'] = 0
+        self._next_continuous_check = CONTINUOUS_MILESTONES[0]
     
     def on_orb_destroyed(self, count=1):
         """Called when orbs are destroyed"""
         self.manager.stats['orbs_destroyed'] += count
-        self.check_all()
+        self._check_stats('orbs_destroyed')
     
     def on_level_complete(self, level):
         """Called when level is completed"""
-        self.manager.stats['levels_completed'] += 1
-        self.manager.stats['max_level_reached'] = max(
-            self.manager.stats['max_level_reached'], 
-            level
-        )
-        self.check_all()
+        stats = self.manager.stats
+        stats['levels_completed'] += 1
+        stats['max_level_reached'] = max(stats['max_level_reached'], level)
+        self._check_stats('levels_completed', 'max_level_reached')
     
     def on_combo(self, combo):
         """Called when combo is achieved"""
-        self.manager.stats['max_combo'] = max(
-            self.manager.stats['max_combo'],
-            combo
-        )
-        self.check_all()
+        stats = self.manager.stats
+        if combo <= stats['max_combo']:
+            return  # Not a new best, no threshold can have been crossed
+        stats['max_combo'] = combo
+        self._check_stats('max_combo')
     
     def on_shot_fired(self, hit):
         """Called when shot is fired"""
-        self.manager.stats['shots_fired'] += 1
+        stats = self.manager.stats
+        stats['shots_fired'] += 1
         
         if hit:
-            self.manager.stats['shots_hit'] += 1
-            self.manager.stats['consecutive_hits'] += 1
+            stats['shots_hit'] += 1
+            stats['consecutive_hits'] += 1
         else:
-            self.manager.stats['consecutive_hits'] = 0
+            stats['consecutive_hits'] = 0
         
-        self.check_all()
+        self._check_stats('consecutive_hits')
     
     def on_danger_survived(self, duration):
         """Called when surviving in danger state"""
-        self.manager.stats['danger_time'] = max(
-            self.manager.stats['danger_time'],
-            duration
-        )
-        self.check_all()
+        stats = self.manager.stats
+        if duration <= stats['danger_time']:
+            return  # Not a new best, no threshold can have been crossed
+        stats['danger_time'] = duration
+        self._check_stats('danger_time')
     
     def on_black_hole_enter(self):
         """Called when entering black hole"""
-        self.manager.unlock('event_horizon')
-        self.manager.stats['black_hole_enters'] += 1
-        self.check_all()
+        manager = self.manager
+        manager.unlock('event_horizon')
+        manager.stats['black_hole_enters'] += 1
+        self._check_stats('black_hole_enters')
     
     def on_story_viewed(self, completed=False):
         """Called when story is viewed"""
-        self.manager.stats['story_viewed'] = True
+        stats = self.manager.stats
+        stats['story_viewed'] = True
         if completed:
-            self.manager.stats['story_completed'] = True
-        self.check_all()
+            stats['story_completed'] = True
+        self._check_stats('story_viewed', 'story_completed')
     
     def on_game_over(self):
         """Called on game over"""
-        self.manager.stats['game_overs'] += 1
-        self.manager.stats['continuous_playtime'] = 0
-        self.check_all()
+        stats = self.manager.stats
+        stats['game_overs'] += 1
+        stats['continuous_playtime'] = 0
+        self._next_continuous_check = CONTINUOUS_MILESTONES[0]
+        self._check_stats('game_overs')
     
     def update_playtime(self, dt):
-        """Update playtime counters"""
-        self.manager.stats['total_playtime'] += dt
-        self.manager.stats['continuous_playtime'] += dt
-        self.check_all()
+        """Update playtime counters (only checks when a milestone is reached)"""
+        stats = self.manager.stats
+        stats['total_playtime'] += dt
+        stats['continuous_playtime'] += dt
+        
+        if (stats['total_playtime'] >= self._next_playtime_check or
+                stats['continuous_playtime'] >= self._next_continuous_check):
+            self.check_all()
+            self._schedule_timer_checks()
     
     def update_idle_time(self, dt):
         """Update idle time (main menu)"""
-        self.manager.stats['idle_time'] += dt
-        self.check_all()
+        stats = self.manager.stats
+        stats['idle_time'] += dt
+        
+        if stats['idle_time'] >= self._next_idle_check:
+            self.check_all()
+            self._schedule_timer_checks()
     
     def on_level_complete_close_call(self, orbs_remaining):
         """Called when level completed with few orbs"""
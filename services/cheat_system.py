@@ -3,6 +3,23 @@ Cheat system for Ancient Tiger
 Developer tools and cheats
 """
 
+from types import MappingProxyType
+
+
+def _group_cheats(cheat_codes):
+    """Group cheat definitions into a read-only {category: (cheat, ...)}"""
+    categories = {}
+    for code, info in cheat_codes.items():
+        categories.setdefault(info['category'], []).append(MappingProxyType({
+            'code': code,
+            'description': info['description'],
+            'needs_param': info.get('needs_param', False)
+        }))
+    return MappingProxyType({
+        category: tuple(cheats) for category, cheats in categories.items()
+    })
+
+
 class CheatSystem:
     """Manages cheat codes and their effects"""
     
@@ -155,6 +172,14 @@ class CheatSystem:
         }
     }
     
+    _CATEGORIES_CACHE = _group_cheats(CHEAT_CODES)
+    
+    __slots__ = (
+        'game_manager', 'active_cheats', 'cheat_history',
+        'god_mode', 'speed_multiplier', 'no_spawn', 'no_clip',
+        'show_fps', 'show_full_path', 'party_mode', 'orb_size_multiplier'
+    )
+    
     def __init__(self, game_manager):
         self.game_manager = game_manager
         self.active_cheats = set()
@@ -172,21 +197,20 @@ class CheatSystem:
         
     def execute_cheat(self, cheat_input):
         """Execute cheat code"""
-        # Parse input
-        parts = cheat_input.strip().upper().split()
+        # Parse input: "CODE [param]" (any whitespace, extra tokens ignored)
+        parts = cheat_input.split(None, 2)
         if not parts:
             return False, "No cheat code entered"
         
-        cheat_code = parts[0]
-        param = parts[1] if len(parts) > 1 else None
+        cheat_code = parts[0].upper()
+        param = parts[1].upper() if len(parts) > 1 else None
         
         # Check if cheat exists
-        if cheat_code not in self.CHEAT_CODES:
+        if cheat_code not in _CHEAT_CODES:
             return False, f"Unknown cheat: {cheat_code}"
         
         # Check if param needed
-        cheat_info = self.CHEAT_CODES[cheat_code]
-        if cheat_info.get('needs_param') and not param:
+        if not param and cheat_code in _NEEDS_PARAM:
             return False, f"Missing parameter for {cheat_code}"
         
         # Execute cheat
@@ -205,169 +229,182 @@ class CheatSystem:
     
     def _apply_cheat(self, cheat_code, param):
         """Apply specific cheat effect"""
-        
-        # Lives & Health
-        if cheat_code == "GODMODE":
-            self.god_mode = not self.god_mode
-            return True, f"God mode {'ON' if self.god_mode else 'OFF'}"
-        
-        elif cheat_code == "MORELIVES":
-            self.game_manager.lives += 5
-            return True, f"Lives: {self.game_manager.lives}"
-        
-        elif cheat_code == "MAXLIVES":
-            self.game_manager.lives = 99
-            return True, "Lives set to 99"
-        
-        # Score
-        elif cheat_code == "RICHMAN":
-            self.game_manager.total_score += 10000
-            self.game_manager.check_high_score(self.game_manager.total_score)
-            return True, "SCORE_UPDATE"
-        
-        elif cheat_code == "MILLIONAIRE":
-            self.game_manager.total_score += 100000
-            self.game_manager.check_high_score(self.game_manager.total_score)
-            return True, "SCORE_UPDATE"
-        
-        elif cheat_code == "HIGHSCORE":
-            self.game_manager.total_score = 999999
-            self.game_manager.check_high_score(self.game_manager.total_score)
-            return True, "SCORE_UPDATE"
-        
-        # Level
-        elif cheat_code == "SKIPTHIS":
-            return True, "SKIP_LEVEL"  # Special flag
-        
-        elif cheat_code == "LEVELUP":
-            return True, "LEVEL_UP" # Changed to flag to trigger transition
-        
-        elif cheat_code == "GOTOLEVEL":
-            try:
-                target_level = int(param)
-                if 1 <= target_level <= 50:
-                    self.game_manager.current_level = target_level
-                    return True, f"GOTO_LEVEL:{target_level}"
-                else:
-                    return False, "Level must be between 1-50"
-            except ValueError:
-                return False, "Invalid level number"
-        
-        elif cheat_code == "FINALLEVEL":
-            self.game_manager.current_level = 50
-            return True, "GOTO_LEVEL:50"
-        
-        # Speed
-        elif cheat_code == "SLOWMO":
-            self.speed_multiplier = 0.5
-            return True, "Slow motion activated"
-        
-        elif cheat_code == "TURBO":
-            self.speed_multiplier = 2.0
-            return True, "Turbo mode activated"
-        
-        elif cheat_code == "NORMALSPEED":
-            self.speed_multiplier = 1.0
-            return True, "Speed normalized"
-        
-        elif cheat_code == "FREEZEORBS":
-            return True, "FREEZE_ORBS"
-        
-        # Powerups
-        elif cheat_code == "POWERUP":
-            return True, "SPAWN_POWERUP"
-        
-        elif cheat_code == "ALLPOWER":
-            return True, "ALL_POWERUPS"
-        
-        elif cheat_code == "BOMBRAIN":
-            return True, "BOMB_RAIN"
-        
-        # Orbs
-        elif cheat_code == "CLEARORBS":
-            return True, "CLEAR_ORBS"
-        
-        elif cheat_code == "RAINBOW":
-            return True, "RAINBOW_MODE"
-        
-        elif cheat_code == "NOSPAWN":
-            self.no_spawn = not self.no_spawn
-            return True, f"No spawn {'ON' if self.no_spawn else 'OFF'}"
-        
-        # Achievement
-        elif cheat_code == "UNLOCKALL":
-            if hasattr(self.game_manager, 'achievement_manager'):
-                for ach_id in self.game_manager.achievement_manager.ACHIEVEMENTS:
-                    self.game_manager.achievement_manager.unlock(ach_id)
-                return True, "All achievements unlocked"
-            return False, "Achievement system not available"
-        
-        elif cheat_code == "RESETACH":
-            if hasattr(self.game_manager, 'achievement_manager'):
-                self.game_manager.achievement_manager.unlocked = {}
-                self.game_manager.achievement_manager.save_achievements()
-                return True, "Achievements reset"
-            return False, "Achievement system not available"
-        
-        elif cheat_code == "GIVEACH":
-            if hasattr(self.game_manager, 'achievement_manager'):
-                if self.game_manager.achievement_manager.unlock(param.lower()):
-                    return True, f"Achievement unlocked: {param}"
-                return False, f"Failed to unlock: {param}"
-            return False, "Achievement system not available"
-        
-        # Debug
-        elif cheat_code == "SHOWFPS":
-            self.show_fps = not self.show_fps
-            return True, f"FPS display {'ON' if self.show_fps else 'OFF'}"
-        
-        elif cheat_code == "SHOWPATH":
-            self.show_full_path = not self.show_full_path
-            return True, f"Full path {'ON' if self.show_full_path else 'OFF'}"
-        
-        elif cheat_code == "NOCLIP":
-            self.no_clip = not self.no_clip
-            return True, f"No clip {'ON' if self.no_clip else 'OFF'}"
-        
-        # Fun
-        elif cheat_code == "PARTY":
-            self.party_mode = not self.party_mode
-            return True, f"Party mode {'ON' if self.party_mode else 'OFF'}"
-        
-        elif cheat_code == "BIGHEAD":
-            self.orb_size_multiplier = 2.0
-            return True, "Big orbs activated"
-        
-        elif cheat_code == "TINY":
-            self.orb_size_multiplier = 0.5
-            return True, "Tiny orbs activated"
-        
-        # Secret
-        elif cheat_code == "KONAMI":
-            return True, "KONAMI_CODE"
-        
-        elif cheat_code == "DEVELOPER":
-            if hasattr(self.game_manager, 'achievement_manager'):
-                self.game_manager.achievement_manager.unlock('developer_secret')
-                return True, "Developer achievement unlocked"
-            return False, "Achievement system not available"
-        
-        return False, "Cheat not implemented"
+        flag = self._FLAG_MAP.get(cheat_code)
+        if flag is not None:
+            return True, flag
+        
+        handler = self._HANDLERS.get(cheat_code)
+        if handler is None:
+            return False, "Cheat not implemented"
+        return handler(self, param)
+    
+    # Lives & Health
+    def _do_godmode(self, param):
+        self.god_mode = not self.god_mode
+        return True, f"God mode {'ON' if self.god_mode else 'OFF'}"
+    
+    def _do_morelives(self, param):
+        self.game_manager.lives += 5
+        return True, f"Lives: {self.game_manager.lives}"
+    
+    def _do_maxlives(self, param):
+        self.game_manager.lives = 99
+        return True, "Lives set to 99"
+    
+    # Score
+    def _do_richman(self, param):
+        self.game_manager.total_score += 10000
+        self.game_manager.check_high_score(self.game_manager.total_score)
+        return True, "SCORE_UPDATE"
+    
+    def _do_millionaire(self, param):
+        self.game_manager.total_score += 100000
+        self.game_manager.check_high_score(self.game_manager.total_score)
+        return True, "SCORE_UPDATE"
+    
+    def _do_highscore(self, param):
+        self.game_manager.total_score = 999999
+        self.game_manager.check_high_score(self.game_manager.total_score)
+        return True, "SCORE_UPDATE"
+    
+    # Level
+    def _do_gotolevel(self, param):
+        try:
+            target_level = int(param)
+            if 1 <= target_level <= 50:
+                self.game_manager.current_level = target_level
+                return True, f"GOTO_LEVEL:{target_level}"
+            else:
+                return False, "Level must be between 1-50"
+        except ValueError:
+            return False, "Invalid level number"
+    
+    def _do_finallevel(self, param):
+        self.game_manager.current_level = 50
+        return True, "GOTO_LEVEL:50"
+    
+    # Speed
+    def _do_slowmo(self, param):
+        self.speed_multiplier = 0.5
+        return True, "Slow motion activated"
+    
+    def _do_turbo(self, param):
+        self.speed_multiplier = 2.0
+        return True, "Turbo mode activated"
+    
+    def _do_normalspeed(self, param):
+        self.speed_multiplier = 1.0
+        return True, "Speed normalized"
+    
+    # Orbs
+    def _do_nospawn(self, param):
+        self.no_spawn = not self.no_spawn
+        return True, f"No spawn {'ON' if self.no_spawn else 'OFF'}"
+    
+    # Achievement
+    def _do_unlockall(self, param):
+        if hasattr(self.game_manager, 'achievement_manager'):
+            for ach_id in self.game_manager.achievement_manager.ACHIEVEMENTS:
+                self.game_manager.achievement_manager.unlock(ach_id)
+            return True, "All achievements unlocked"
+        return False, "Achievement system not available"
+    
+    def _do_resetach(self, param):
+        if hasattr(self.game_manager, 'achievement_manager'):
+            self.game_manager.achievement_manager.reset_achievements()
+            return True, "Achievements reset"
+        return False, "Achievement system not available"
+    
+    def _do_giveach(self, param):
+        if hasattr(self.game_manager, 'achievement_manager'):
+            if self.game_manager.achievement_manager.unlock(param.lower()):
+                return True, f"Achievement unlocked: {param}"
+            return False, f"Failed to unlock: {param}"
+        return False, "Achievement system not available"
+    
+    # Debug
+    def _do_showfps(self, param):
+        self.show_fps = not self.show_fps
+        return True, f"FPS display {'ON' if self.show_fps else 'OFF'}"
+    
+    def _do_showpath(self, param):
+        self.show_full_path = not self.show_full_path
+        return True, f"Full path {'ON' if self.show_full_path else 'OFF'}"
+    
+    def _do_noclip(self, param):
+        self.no_clip = not self.no_clip
+        return True, f"No clip {'ON' if self.no_clip else 'OFF'}"
+    
+    # Fun
+    def _do_party(self, param):
+        self.party_mode = not self.party_mode
+        return True, f"Party mode {'ON' if self.party_mode else 'OFF'}"
+    
+    def _do_bighead(self, param):
+        self.orb_size_multiplier = 2.0
+        return True, "Big orbs activated"
+    
+    def _do_tiny(self, param):
+        self.orb_size_multiplier = 0.5
+        return True, "Tiny orbs activated"
+    
+    # Secret
+    def _do_developer(self, param):
+        if hasattr(self.game_manager, 'achievement_manager'):
+            self.game_manager.achievement_manager.unlock('developer_secret')
+            return True, "Developer achievement unlocked"
+        return False, "Achievement system not available"
+    
+    # Cheats that only hand a flag back to the game scene
+    _FLAG_MAP = {
+        "SKIPTHIS": "SKIP_LEVEL",
+        "LEVELUP": "LEVEL_UP",  # Flag so the scene plays the transition
+        "FREEZEORBS": "FREEZE_ORBS",
+        "POWERUP": "SPAWN_POWERUP",
+        "ALLPOWER": "ALL_POWERUPS",
+        "BOMBRAIN": "BOMB_RAIN",
+        "CLEARORBS": "CLEAR_ORBS",
+        "RAINBOW": "RAINBOW_MODE",
+        "KONAMI": "KONAMI_CODE",
+    }
+    
+    # Cheat code -> handler(self, param) returning (success, message)
+    _HANDLERS = {
+        "GODMODE": _do_godmode,
+        "MORELIVES": _do_morelives,
+        "MAXLIVES": _do_maxlives,
+        "RICHMAN": _do_richman,
+        "MILLIONAIRE": _do_millionaire,
+        "HIGHSCORE": _do_highscore,
+        "GOTOLEVEL": _do_gotolevel,
+        "FINALLEVEL": _do_finallevel,
+        "SLOWMO": _do_slowmo,
+        "TURBO": _do_turbo,
+        "NORMALSPEED": _do_normalspeed,
+        "NOSPAWN": _do_nospawn,
+        "UNLOCKALL": _do_unlockall,
+        "RESETACH": _do_resetach,
+        "GIVEACH": _do_giveach,
+        "SHOWFPS": _do_showfps,
+        "SHOWPATH": _do_showpath,
+        "NOCLIP": _do_noclip,
+        "PARTY": _do_party,
+        "BIGHEAD": _do_bighead,
+        "TINY": _do_tiny,
+        "DEVELOPER": _do_developer,
+    }
     
     def get_all_cheats_by_category(self):
-        """Get cheats organized by category"""
-        categories = {}
-        for code, info in self.CHEAT_CODES.items():
-            category = info['category']
-            if category not in categories:
-                categories[category] = []
-            categories[category].append({
-                'code': code,
-                'description': info['description'],
-                'needs_param': info.get('needs_param', False)
-            })
-        return categories
+        """Get cheats organized by category (read-only, built once)"""
+        return self._CATEGORIES_CACHE
     
     def is_active(self, cheat_code):
         """Check if cheat is active"""
-        return cheat_code in self.active_cheats
\ No newline at end of file
+        return cheat_code in self.active_cheats
+
+
+# Module-level aliases so execute_cheat skips the class attribute lookup
+_CHEAT_CODES = CheatSystem.CHEAT_CODES
+_NEEDS_PARAM = frozenset(
+    code for code, info in _CHEAT_CODES.items() if info.get('needs_param')
+)
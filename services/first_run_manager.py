@@ -4,6 +4,7 @@ First run detection manager
 
 import os
 import sys
+import functools
 from pathlib import Path
 
 class FirstRunManager:
@@ -12,6 +13,7 @@ class FirstRunManager:
     def __init__(self):
         self.first_run_dir = self._get_first_run_directory()
         self.first_run_file = self.first_run_dir / ".firstrun"
+        self._first_run_file_str = str(self.first_run_file)
         
         # Ensure directory exists
         try:
@@ -20,8 +22,10 @@ class FirstRunManager:
         except Exception as e:
             print(f"FirstRunManager: Error creating directory {e}")
     
-    def _get_first_run_directory(self):
-        """Get platform-specific directory (same as save/settings)"""
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def _get_first_run_directory():
+        """Get platform-specific directory (same as save/settings), resolved once"""
         app_name = "MacanAncient"
         
         if os.name == 'nt':  # Windows
@@ -45,7 +49,7 @@ class FirstRunManager:
     
     def is_first_run(self):
         """Check if this is the first run"""
-        return not self.first_run_file.exists()
+        return not os.path.exists(self._first_run_file_str)
     
     def mark_not_first_run(self):
         """Mark that the game has been run"""
@@ -3,21 +3,94 @@ Image cache manager for QPixmap optimization
 Stores scaled wallpapers in Local AppData to avoid re-rendering
 """
 
-import json
+import atexit
+import functools
 import os
+import pickle
+import shutil
 import sys
+import threading
+import uuid
 from pathlib import Path
-from PySide6.QtGui import QPixmap
-from PySide6.QtCore import QSize, Qt
+from PySide6.QtGui import QPixmap, QPixmapCache, QImage, QImageReader
+from PySide6.QtCore import (QSize, Qt, QTimer, QObject, QRunnable, QThreadPool,
+                            Signal, Slot)
 import hashlib
 
+INDEX_FLUSH_DELAY_MS = 2000  # Coalesce index writes from a burst of misses
+MEMORY_CACHE_BUDGET = 128 * 1024 * 1024  # Minimum QPixmapCache size, in bytes
+
+# Scaled images are stored as uncompressed PNG (quality 100 = zlib level 0):
+# bigger on disk than webp, but reloading skips the expensive decode
+CACHE_FORMAT = "png"
+CACHE_QUALITY = 100
+CACHE_GLOBS = ("*.png", "*.webp")  # webp: files written by older versions
+
+# Qt enums resolved once; _ASPECT is indexed by keep_aspect_ratio
+_ASPECT = (Qt.IgnoreAspectRatio, Qt.KeepAspectRatioByExpanding)
+_SMOOTH = Qt.SmoothTransformation
+
+
+class _ScaleNotifier(QObject):
+    """Carries finished scale jobs from the worker threads to the GUI thread"""
+    
+    finished = Signal(str, QImage, str)  # cache_key, scaled image, source hash
+    
+    def __init__(self, handler):
+        super().__init__()
+        self._handler = handler
+        # Receiver lives on the GUI thread, so worker emits are queued
+        self.finished.connect(self._deliver)
+    
+    @Slot(str, QImage, str)
+    def _deliver(self, cache_key, image, file_hash):
+        self._handler(cache_key, image, file_hash)
+
+
+class _ScaleJob(QRunnable):
+    """Loads, scales and encodes one cache miss on a QThreadPool worker"""
+    
+    def __init__(self, cache_key, source_path, target_size, aspect_mode,
+                 cached_path, hash_file, notifier):
+        super().__init__()
+        self.cache_key = cache_key
+        self.source_path = source_path
+        self.target_size = QSize(target_size)
+        self.aspect_mode = aspect_mode
+        self.cached_path = cached_path
+        self.hash_file = hash_file
+        self.notifier = notifier
+    
+    def run(self):
+        # QImage (unlike QPixmap) is safe to use off the GUI thread
+        image = QImage(self.source_path)
+        file_hash = ""
+        if not image.isNull():
+            image = image.scaled(self.target_size, self.aspect_mode, _SMOOTH)
+            try:
+                if image.save(self.cached_path, CACHE_FORMAT, CACHE_QUALITY):
+                    file_hash = self.hash_file(self.source_path) or ""
+            except Exception as e:
+                print(f"ImageCache: Error saving cache: {e}")
+        self.notifier.finished.emit(self.cache_key, image, file_hash)
+
+
 class ImageCache:
     """Manages cached QPixmap images for optimal performance"""
     
     def __init__(self):
         self.cache_dir = self._get_cache_directory()
-        self.cache_index_file = self.cache_dir / "cache_index.json"
-        self.memory_cache = {}  # In-memory cache for session
+        self.cache_index_file = self.cache_dir / "cache_index.pkl"
+        self._memory_keys = set()  # Our entries in the shared QPixmapCache
+        self._hash_cache = {}  # (path, mtime, size) -> source file hash
+        self._pending = {}  # cache_key -> in-flight background scale job
+        self._notifier = _ScaleNotifier(self._on_scale_finished)
+        
+        # Qt's process-wide pixmap LRU is the memory tier; make sure it can
+        # hold a few screen-sized wallpapers (the limit is in KB)
+        QPixmapCache.setCacheLimit(
+            max(QPixmapCache.cacheLimit(), MEMORY_CACHE_BUDGET // 1024)
+        )
         
         # Ensure cache directory exists
         try:
@@ -26,11 +99,18 @@ class ImageCache:
         except Exception as e:
             print(f"ImageCache: Error creating cache directory {e}")
         
+        # Finish deleting caches cleared by a run that exited mid-delete
+        self._delete_trash_dirs()
+        
         # Load cache index
         self.cache_index = self._load_cache_index()
+        self._index_dirty = False
+        atexit.register(self._flush_cache_index)
         
-    def _get_cache_directory(self):
-        """Get platform-specific cache directory"""
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def _get_cache_directory():
+        """Get platform-specific cache directory (resolved once per process)"""
         app_name = "MacanAncient"
         
         if os.name == 'nt':  # Windows
@@ -53,28 +133,48 @@ class ImageCache:
         return home / ".cache" / app_name
     
     def _load_cache_index(self):
-        """Load cache index from JSON"""
+        """Load cache index (a pickled dict)"""
         try:
             if self.cache_index_file.exists():
-                with open(self.cache_index_file, 'r') as f:
-                    return json.load(f)
+                return pickle.loads(self.cache_index_file.read_bytes())
         except Exception as e:
             print(f"ImageCache: Error loading cache index: {e}")
         return {}
     
     def _save_cache_index(self):
-        """Save cache index to JSON"""
+        """Save cache index"""
+        self._index_dirty = False
         try:
-            with open(self.cache_index_file, 'w') as f:
-                json.dump(self.cache_index, f, indent=4)
+            self.cache_index_file.write_bytes(
+                pickle.dumps(self.cache_index, protocol=pickle.HIGHEST_PROTOCOL)
+            )
         except Exception as e:
             print(f"ImageCache: Error saving cache index: {e}")
     
+    def _mark_index_dirty(self):
+        """Schedule a single deferred index write for a burst of changes"""
+        if not self._index_dirty:
+            self._index_dirty = True
+            QTimer.singleShot(INDEX_FLUSH_DELAY_MS, self._flush_cache_index)
+    
+    def _flush_cache_index(self):
+        """Write the cache index if it has unsaved changes"""
+        if self._index_dirty:
+            self._save_cache_index()
+    
     def _get_file_hash(self, file_path):
-        """Get MD5 hash of file for change detection"""
+        """Get BLAKE2 hash of file for change detection (streamed in 1 MB blocks)"""
         try:
-            with open(file_path, 'rb') as f:
-                file_hash = hashlib.md5(f.read()).hexdigest()
+            st = os.stat(file_path)
+            key = (str(file_path), st.st_mtime, st.st_size)
+            file_hash = self._hash_cache.get(key)
+            if file_hash is None:
+                digest = hashlib.blake2b(digest_size=16)
+                with open(file_path, 'rb') as f:
+                    for chunk in iter(lambda: f.read(1 << 20), b''):
+                        digest.update(chunk)
+                file_hash = digest.hexdigest()
+                self._hash_cache[key] = file_hash
             return file_hash
         except Exception as e:
             print(f"ImageCache: Error hashing file: {e}")
@@ -82,12 +182,12 @@ class ImageCache:
     
     def _generate_cache_key(self, image_path, size):
         """Generate cache key for image + size combination"""
-        path_str = str(image_path)
-        size_str = f"{size.width()}x{size.height()}"
-        cache_key = hashlib.md5(f"{path_str}_{size_str}".encode()).hexdigest()
-        return cache_key
+        digest = hashlib.blake2b(os.fsencode(image_path), digest_size=8)
+        digest.update(b"|%dx%d" % (size.width(), size.height()))
+        return digest.hexdigest()
     
-    def get_scaled_pixmap(self, image_path, target_size, keep_aspect_ratio=True):
+    def get_scaled_pixmap(self, image_path, target_size, keep_aspect_ratio=True,
+                          callback=None):
         """
         Get scaled pixmap from cache or create new one
         
@@ -95,14 +195,18 @@ class ImageCache:
             image_path: Path to source image
             target_size: QSize target size
             keep_aspect_ratio: Whether to keep aspect ratio
+            callback: If given, a cache miss is scaled on a worker thread and
+                callback(pixmap or None) is called on the GUI thread when done
             
         Returns:
-            QPixmap or None
+            QPixmap or None (always None for a miss when callback is given)
         """
         image_path = Path(image_path)
         
-        # Check if source file exists
-        if not image_path.exists():
+        # Check if source file exists (the stat is reused to validate the disk cache)
+        try:
+            source_stat = os.stat(image_path)
+        except OSError:
             print(f"ImageCache: Source image not found: {image_path}")
             return None
         
@@ -110,29 +214,52 @@ class ImageCache:
         cache_key = self._generate_cache_key(image_path, target_size)
         
         # Check memory cache first (fastest)
-        if cache_key in self.memory_cache:
+        pixmap = QPixmapCache.find(self._memory_key(cache_key))
+        if pixmap is not None:
             print(f"ImageCache: Hit (memory) for {image_path.name}")
-            return self.memory_cache[cache_key]
+            return pixmap
         
         # Check disk cache
-        cached_file = self.cache_dir / f"{cache_key}.webp"
-        file_hash = self._get_file_hash(image_path)
+        cached_file = self.cache_dir / f"{cache_key}.{CACHE_FORMAT}"
+        cached_path = str(cached_file)
+        file_hash = None
         
         # Validate cache entry
         if cache_key in self.cache_index:
             cache_entry = self.cache_index[cache_key]
             
+            # Unchanged mtime + size means an unchanged source; only hash
+            # the file when they differ (or the entry predates them)
+            source_unchanged = (
+                cache_entry.get('source_mtime') == source_stat.st_mtime and
+                cache_entry.get('source_size') == source_stat.st_size
+            )
+            if not source_unchanged:
+                file_hash = self._get_file_hash(image_path)
+                source_unchanged = cache_entry.get('source_hash') == file_hash
+                if source_unchanged:
+                    # Same content, just touched - record the new stat
+                    cache_entry['source_mtime'] = source_stat.st_mtime
+                    cache_entry['source_size'] = source_stat.st_size
+                    self._mark_index_dirty()
+            
             # Check if source file hasn't changed and cached file exists
-            if (cache_entry.get('source_hash') == file_hash and 
-                cached_file.exists()):
+            if source_unchanged and os.path.exists(cached_path):
                 
                 # Load from disk cache
-                pixmap = QPixmap(str(cached_file))
+                pixmap = self._read_cached_file(cached_path)
                 if not pixmap.isNull():
                     print(f"ImageCache: Hit (disk) for {image_path.name}")
-                    self.memory_cache[cache_key] = pixmap
+                    self._remember(cache_key, pixmap)
                     return pixmap
         
+        aspect_mode = _ASPECT[bool(keep_aspect_ratio)]
+        
+        if callback is not None:
+            self._scale_in_background(cache_key, image_path, source_stat, target_size,
+                                      aspect_mode, cached_path, callback)
+            return None
+        
         # Cache miss - create new scaled pixmap
         print(f"ImageCache: Miss for {image_path.name}, creating scaled version...")
         
@@ -142,47 +269,122 @@ class ImageCache:
             return None
         
         # Scale pixmap
-        aspect_mode = Qt.KeepAspectRatioByExpanding if keep_aspect_ratio else Qt.IgnoreAspectRatio
         scaled_pixmap = original_pixmap.scaled(
             target_size,
             aspect_mode,
-            Qt.SmoothTransformation
+            _SMOOTH
         )
         
         # Save to disk cache
         try:
-            scaled_pixmap.save(str(cached_file), "webp")
+            scaled_pixmap.save(cached_path, CACHE_FORMAT, CACHE_QUALITY)
             
             # Update cache index
-            self.cache_index[cache_key] = {
-                'source_path': str(image_path),
-                'source_hash': file_hash,
-                'size': f"{target_size.width()}x{target_size.height()}",
-                'cached_file': str(cached_file)
-            }
-            self._save_cache_index()
-            
-            print(f"ImageCache: Cached {image_path.name} as {cache_key}.webp")
+            if file_hash is None:
+                file_hash = self._get_file_hash(image_path)
+            self._record_entry(cache_key, image_path, file_hash, source_stat,
+                               target_size, cached_path)
             
         except Exception as e:
             print(f"ImageCache: Error saving cache: {e}")
         
         # Store in memory cache
-        self.memory_cache[cache_key] = scaled_pixmap
+        self._remember(cache_key, scaled_pixmap)
         
         return scaled_pixmap
     
+    def _record_entry(self, cache_key, image_path, file_hash, source_stat,
+                      target_size, cached_path):
+        """Add a freshly written disk cache file to the index"""
+        self.cache_index[cache_key] = {
+            'source_path': str(image_path),
+            'source_hash': file_hash,
+            'source_mtime': source_stat.st_mtime,
+            'source_size': source_stat.st_size,
+            'size': f"{target_size.width()}x{target_size.height()}",
+            'cached_file': cached_path
+        }
+        self._mark_index_dirty()
+        
+        print(f"ImageCache: Cached {image_path.name} as {cache_key}.{CACHE_FORMAT}")
+    
+    @staticmethod
+    def _read_cached_file(cached_path):
+        """Read a cached file without EXIF transform or allocation-limit checks"""
+        reader = QImageReader(cached_path, CACHE_FORMAT.encode())
+        reader.setAutoTransform(False)
+        reader.setAllocationLimit(0)
+        return QPixmap.fromImage(reader.read())
+    
+    def _scale_in_background(self, cache_key, image_path, source_stat, target_size,
+                             aspect_mode, cached_path, callback):
+        """Queue a cache miss on the global thread pool (one job per key)"""
+        job = self._pending.get(cache_key)
+        if job is not None:
+            job['callbacks'].append(callback)
+            return
+        
+        print(f"ImageCache: Miss for {image_path.name}, scaling in background...")
+        self._pending[cache_key] = {
+            'image_path': image_path,
+            'source_stat': source_stat,
+            'target_size': QSize(target_size),
+            'cached_path': cached_path,
+            'callbacks': [callback]
+        }
+        QThreadPool.globalInstance().start(_ScaleJob(
+            cache_key, str(image_path), target_size, aspect_mode, cached_path,
+            self._get_file_hash, self._notifier
+        ))
+    
+    def _on_scale_finished(self, cache_key, image, file_hash):
+        """GUI-thread completion of a background scale job"""
+        job = self._pending.pop(cache_key, None)
+        if job is None:
+            return
+        
+        pixmap = None
+        if image.isNull():
+            print(f"ImageCache: Failed to load image: {job['image_path']}")
+        else:
+            pixmap = QPixmap.fromImage(image)
+            if file_hash:
+                self._record_entry(cache_key, job['image_path'], file_hash,
+                                   job['source_stat'], job['target_size'],
+                                   job['cached_path'])
+            self._remember(cache_key, pixmap)
+        
+        for callback in job['callbacks']:
+            callback(pixmap)
+    
+    @staticmethod
+    def _memory_key(cache_key):
+        """Namespace our keys inside the shared QPixmapCache"""
+        return f"image_cache:{cache_key}"
+    
+    def _remember(self, cache_key, pixmap):
+        """Add pixmap to the memory tier (QPixmapCache evicts LRU over its limit)"""
+        memory_key = self._memory_key(cache_key)
+        if QPixmapCache.insert(memory_key, pixmap):
+            self._memory_keys.add(memory_key)
+    
     def clear_memory_cache(self):
         """Clear in-memory cache"""
-        self.memory_cache.clear()
+        for memory_key in self._memory_keys:
+            QPixmapCache.remove(memory_key)
+        self._memory_keys.clear()
         print("ImageCache: Memory cache cleared")
     
     def clear_disk_cache(self):
         """Clear disk cache"""
         try:
-            # Remove all cached files
-            for cache_file in self.cache_dir.glob("*.webp"):
-                cache_file.unlink()
+            # Swap in an empty directory, then delete the old one off the UI thread
+            trash_dir = self.cache_dir.with_name(
+                f"{self.cache_dir.name}.trash-{uuid.uuid4().hex}"
+            )
+            self.cache_dir.rename(trash_dir)
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            self._delete_trash_dirs()
             
             # Clear cache index
             self.cache_index = {}
@@ -195,12 +397,29 @@ class ImageCache:
             print(f"ImageCache: Error clearing disk cache: {e}")
             return False
     
+    def _delete_trash_dirs(self):
+        """Remove cleared cache directories on a background thread"""
+        try:
+            trash_dirs = list(self.cache_dir.parent.glob(f"{self.cache_dir.name}.trash-*"))
+        except OSError:
+            return
+        if not trash_dirs:
+            return
+        
+        def delete():
+            for trash_dir in trash_dirs:
+                shutil.rmtree(trash_dir, ignore_errors=True)
+        
+        # Daemon thread: anything left over is picked up by the next start
+        threading.Thread(target=delete, daemon=True).start()
+    
     def get_cache_size(self):
         """Get total size of disk cache in bytes"""
         total_size = 0
         try:
-            for cache_file in self.cache_dir.glob("*.webp"):
-                total_size += cache_file.stat().st_size
+            for pattern in CACHE_GLOBS:
+                for cache_file in self.cache_dir.glob(pattern):
+                    total_size += cache_file.stat().st_size
         except Exception as e:
             print(f"ImageCache: Error calculating cache size: {e}")
         return total_size
@@ -1,24 +1,121 @@
 """
 Orb rendering cache system for optimal performance
-Pre-renders orbs to QPixmap and caches them
+Renders orbs to QPixmap on first use and caches them
 """
 
-from PySide6.QtGui import QPixmap, QPainter, QRadialGradient, QColor, QPen, QFont
+from PySide6.QtGui import (QPixmap, QPixmapCache, QPainter, QRadialGradient,
+                           QColor, QPen, QFont)
 from PySide6.QtCore import Qt, QRectF, QPointF
-from games.orb import OrbType
+from games.orb import Orb, OrbType
 import math
 
+PIXMAP_CACHE_BUDGET = 20 * 1024 * 1024  # Minimum QPixmapCache size, in bytes
+
+# Pulse animation frames; a power of two so the frame can be picked with a mask
+PULSE_FRAMES = 8
+_PULSE_SIN = tuple(
+    math.sin(frame / PULSE_FRAMES * 2 * math.pi) for frame in range(PULSE_FRAMES)
+)
+_PULSE_OFFSET_NORMAL = tuple(value * 2 for value in _PULSE_SIN)
+_PULSE_OFFSET_POWERUP = tuple(value * 3 for value in _PULSE_SIN)
+
+# Shrunk (black hole) orbs are cached in tenths of their full size
+SCALE_TIERS = 10
+
+POWERUP_TYPES = frozenset((
+    OrbType.BOMB, OrbType.SLOW, OrbType.REVERSE, OrbType.ACCURACY
+))
+
+# Colours come from Orb.ORB_COLORS; trails skip powerups and explosions
+# swap the bomb's dark grey for orange. QColors are built once and copied
+# by the renderers before they change the alpha.
+_DEFAULT_RGB = (255, 255, 255)
+_TRAIL_COLOR_RGB = {
+    orb_type: rgb for orb_type, rgb in Orb.ORB_COLORS.items()
+    if orb_type not in POWERUP_TYPES
+}
+_EXPLOSION_COLOR_RGB = {**_TRAIL_COLOR_RGB, OrbType.BOMB: (255, 100, 0)}
+
+_DEFAULT_QCOLOR = QColor(*_DEFAULT_RGB)
+_ORB_QCOLOR = {orb_type: QColor(*rgb) for orb_type, rgb in Orb.ORB_COLORS.items()}
+_TRAIL_QCOLOR = {orb_type: QColor(*rgb) for orb_type, rgb in _TRAIL_COLOR_RGB.items()}
+_EXPLOSION_QCOLOR = {
+    orb_type: QColor(*rgb) for orb_type, rgb in _EXPLOSION_COLOR_RGB.items()
+}
+
+# White alpha shapes shared by every orb colour of one size:
+# name -> (centre offset, radius, peak alpha), all relative to the orb radius
+_TEMPLATE_SHAPES = {
+    'glow': (0.0, 1.5, 80),
+    'powerup_glow': (0.0, 2.0, 150),
+    'highlight': (-0.4, 0.4, 150),
+}
+
+# An explosion is three stacked rings (1, 0.7 and 0.4 of the blast radius),
+# each fading out towards its edge. They are drawn as a single gradient whose
+# stops sample the combined alpha at these fractions of the radius.
+_EXPLOSION_RING_SCALES = (1.0, 0.7, 0.4)
+_EXPLOSION_STOPS = (0.0, 0.2, 0.4, 0.55, 0.7, 0.85, 1.0)
+
+
+class _PixmapKeys:
+    """QPixmapCache.Key handles for one cache, looked up by a packed int"""
+    
+    def __init__(self):
+        # (orb_type << 20) | (quarter_radius << 8) | (tier << 4) | frame -> Key
+        self.keys = {}
+        
+        QPixmapCache.setCacheLimit(
+            max(QPixmapCache.cacheLimit(), PIXMAP_CACHE_BUDGET // 1024)
+        )
+    
+    def find(self, orb_type, radius, frame, tier=0):
+        """Get a cached variation (radius kept to a quarter pixel), or None"""
+        key = self.keys.get(
+            (orb_type << 20) | (int(radius * 4) << 8) | (tier << 4) | frame
+        )
+        if key is None:
+            return None
+        return QPixmapCache.find(key)  # None once the entry is evicted
+    
+    def insert(self, orb_type, radius, frame, pixmap, tier=0):
+        """Cache a variation"""
+        packed = (orb_type << 20) | (int(radius * 4) << 8) | (tier << 4) | frame
+        self.keys[packed] = QPixmapCache.insert(pixmap)
+    
+    def clear(self):
+        """Remove our entries from the shared QPixmapCache"""
+        for key in self.keys.values():
+            QPixmapCache.remove(key)
+        self.keys.clear()
+    
+    def __len__(self):
+        return len(self.keys)
+
+
 class OrbRenderCache:
     """Cache system for pre-rendered orb images"""
     
     def __init__(self):
-        self.cache = {}  # Key: (orb_type, radius, pulse_frame) -> QPixmap
-        self.pulse_frames = 8  # Number of pulse animation frames
+        self.cache = _PixmapKeys()  # QPixmapCache evicts LRU over its limit
+        self.pulse_frames = PULSE_FRAMES  # Number of pulse animation frames
         self.enable_cache = True
         
-        print("OrbRenderCache: Initializing...")
-        self._prerender_all_orbs()
-        print(f"OrbRenderCache: Cached {len(self.cache)} orb variations")
+        # sin() repeats its values (frame k looks like frame pulse_frames/2 - k),
+        # so map every frame to the first one with the same pulse offset.
+        # Rainbow orbs also cycle hue per frame and never use this.
+        offsets = [round(value, 9) for value in _PULSE_SIN]
+        self.canonical_frames = tuple(offsets.index(offset) for offset in offsets)
+        self._templates = {}  # (shape, size, current_radius) -> white QPixmap
+        
+        # Powerup symbol font: the emoji font if installed, bold Arial otherwise
+        if QFont("Segoe UI Emoji").exactMatch():
+            self._symbol_family, self._symbol_weight = "Segoe UI Emoji", QFont.Normal
+        else:
+            self._symbol_family, self._symbol_weight = "Arial", QFont.Bold
+        
+        # Variations are rendered on first request; _prerender_all_orbs()
+        # can still warm the whole set up front
     
     def _prerender_all_orbs(self):
         """Pre-render all orb types and variations"""
@@ -37,30 +134,32 @@ class OrbRenderCache:
         # Common sizes
         sizes = [10, 12, 15]  # next_orb, current_orb, chain_orb
         
+        # Only frames with a distinct pulse offset need their own pixmap
+        all_frames = range(self.pulse_frames)
+        unique_frames = sorted(set(self.canonical_frames))
+        
         # Pre-render normal orbs with pulse animation
         for orb_type in normal_types:
+            frames = all_frames if orb_type == OrbType.RAINBOW else unique_frames
             for radius in sizes:
-                for pulse_frame in range(self.pulse_frames):
+                for pulse_frame in frames:
                     self._render_orb(orb_type, radius, pulse_frame)
         
         # Pre-render powerups (they have different pulse)
         for orb_type in powerup_types:
             for radius in sizes:
-                for pulse_frame in range(self.pulse_frames):
+                for pulse_frame in unique_frames:
                     self._render_orb(orb_type, radius, pulse_frame, is_powerup=True)
     
     def _render_orb(self, orb_type, radius, pulse_frame=0, is_powerup=False):
         """Render single orb to QPixmap and cache it"""
-        cache_key = (orb_type, radius, pulse_frame)
-        
-        if cache_key in self.cache:
-            return self.cache[cache_key]
+        pixmap = self.cache.find(orb_type, radius, pulse_frame)
+        if pixmap is not None:
+            return pixmap
         
         # Calculate pulse offset
-        pulse_progress = pulse_frame / self.pulse_frames
-        pulse_amount = 3 if is_powerup else 2
-        pulse_offset = math.sin(pulse_progress * 2 * math.pi) * pulse_amount
-        current_radius = radius + pulse_offset
+        pulse_offsets = _PULSE_OFFSET_POWERUP if is_powerup else _PULSE_OFFSET_NORMAL
+        current_radius = radius + pulse_offsets[pulse_frame]
         
         # Create pixmap with extra space for glow
         size = int(current_radius * 4)
@@ -72,32 +171,15 @@ class OrbRenderCache:
         
         # Center position
         center = QPointF(size / 2, size / 2)
+        base_color = _ORB_QCOLOR.get(orb_type, _DEFAULT_QCOLOR)
         
-        # --- Draw PowerUp Glow ---
-        if is_powerup:
-            glow_gradient = QRadialGradient(center, current_radius * 2.0)
-            color = self._get_orb_color(orb_type)
-            glow_color = QColor(*color)
-            glow_color.setAlpha(150)
-            glow_gradient.setColorAt(0, glow_color)
-            glow_color.setAlpha(0)
-            glow_gradient.setColorAt(1, glow_color)
-            painter.setBrush(glow_gradient)
-            painter.setPen(Qt.NoPen)
-            painter.drawEllipse(center, current_radius * 2.0, current_radius * 2.0)
-        
-        # --- Normal Outer Glow ---
-        else:
-            glow_gradient = QRadialGradient(center, current_radius * 1.5)
-            color = self._get_orb_color(orb_type)
-            glow_color = QColor(*color)
-            glow_color.setAlpha(80)
-            glow_gradient.setColorAt(0, glow_color)
-            glow_color.setAlpha(0)
-            glow_gradient.setColorAt(1, glow_color)
-            painter.setBrush(glow_gradient)
-            painter.setPen(Qt.NoPen)
-            painter.drawEllipse(center, current_radius * 1.5, current_radius * 1.5)
+        # --- Outer Glow (bigger for PowerUps) ---
+        # The pixmap is still empty, so the white template can be tinted in place
+        glow_shape = 'powerup_glow' if is_powerup else 'glow'
+        painter.drawPixmap(0, 0, self._get_template(glow_shape, size, current_radius))
+        painter.setCompositionMode(QPainter.CompositionMode_SourceIn)
+        painter.fillRect(pixmap.rect(), base_color)
+        painter.setCompositionMode(QPainter.CompositionMode_SourceOver)
         
         # --- Main orb body ---
         main_gradient = QRadialGradient(
@@ -114,8 +196,6 @@ class OrbRenderCache:
             light_color = QColor.fromHsv(int(hue), 180, 255)
             dark_color = QColor(color.red() // 2, color.green() // 2, color.blue() // 2)
         else:
-            rgb = self._get_orb_color(orb_type)
-            base_color = QColor(*rgb)
             light_color = base_color.lighter(150)
             dark_color = base_color.darker(150)
             color = base_color
@@ -135,9 +215,7 @@ class OrbRenderCache:
             
             font_size = int(radius)
             if font_size > 1:
-                font = QFont("Segoe UI Emoji", font_size)
-                if not font.exactMatch():
-                    font = QFont("Arial", font_size, QFont.Bold)
+                font = QFont(self._symbol_family, font_size, self._symbol_weight)
                 
                 painter.setFont(font)
                 rect = QRectF(
@@ -150,26 +228,43 @@ class OrbRenderCache:
         
         # --- Highlight (Glossy effect) ---
         if not is_powerup:
-            highlight_pos = QPointF(
-                center.x() - current_radius * 0.4,
-                center.y() - current_radius * 0.4
-            )
-            highlight_gradient = QRadialGradient(highlight_pos, current_radius * 0.4)
-            highlight_color = QColor(255, 255, 255, 150)
-            highlight_gradient.setColorAt(0, highlight_color)
-            highlight_color.setAlpha(0)
-            highlight_gradient.setColorAt(1, highlight_color)
-            
-            painter.setBrush(highlight_gradient)
-            painter.setPen(Qt.NoPen)
-            painter.drawEllipse(highlight_pos, current_radius * 0.4, current_radius * 0.4)
+            painter.drawPixmap(0, 0, self._get_template('highlight', size, current_radius))
         
         painter.end()
         
         # Cache it
-        self.cache[cache_key] = pixmap
+        self.cache.insert(orb_type, radius, pulse_frame, pixmap)
         return pixmap
     
+    def _get_template(self, shape, size, current_radius):
+        """Get a white glow/highlight shape, rendered once per orb size"""
+        key = (shape, size, current_radius)
+        template = self._templates.get(key)
+        if template is not None:
+            return template
+        
+        offset, reach, alpha = _TEMPLATE_SHAPES[shape]
+        template = QPixmap(size, size)
+        template.fill(Qt.transparent)
+        
+        painter = QPainter(template)
+        painter.setRenderHint(QPainter.Antialiasing)
+        
+        position = size / 2 + current_radius * offset
+        center = QPointF(position, position)
+        shape_radius = current_radius * reach
+        
+        gradient = QRadialGradient(center, shape_radius)
+        gradient.setColorAt(0, QColor(255, 255, 255, alpha))
+        gradient.setColorAt(1, QColor(255, 255, 255, 0))
+        painter.setBrush(gradient)
+        painter.setPen(Qt.NoPen)
+        painter.drawEllipse(center, shape_radius, shape_radius)
+        painter.end()
+        
+        self._templates[key] = template
+        return template
+    
     def get_orb_pixmap(self, orb_type, radius, pulse_time, visible_scale=1.0):
         """
         Get cached orb pixmap
@@ -187,54 +282,61 @@ class OrbRenderCache:
             return None
         
         # Calculate pulse frame
-        pulse_frame = int((pulse_time * 3) % self.pulse_frames)
-        
-        # Get cached pixmap
-        cache_key = (orb_type, radius, pulse_frame)
-        pixmap = self.cache.get(cache_key)
-        
-        if pixmap and visible_scale != 1.0:
-            # Scale for black hole effect
-            new_size = int(pixmap.width() * visible_scale)
-            if new_size < 1:
-                return None
-            pixmap = pixmap.scaled(
-                new_size, new_size,
-                Qt.KeepAspectRatio,
-                Qt.SmoothTransformation
+        pulse_frame = int(pulse_time * 3) & (PULSE_FRAMES - 1)
+        if orb_type != OrbType.RAINBOW:
+            pulse_frame = self.canonical_frames[pulse_frame]
+        
+        # Get cached pixmap, re-rendering it if it was never made or got evicted
+        pixmap = self.cache.find(orb_type, radius, pulse_frame)
+        if pixmap is None:
+            pixmap = self._render_orb(
+                orb_type, radius, pulse_frame, orb_type in POWERUP_TYPES
             )
         
-        return pixmap
+        if not pixmap or visible_scale == 1.0:
+            return pixmap
+        
+        # Scale for black hole effect (an orb shrunk below a pixel is not drawn)
+        new_size = int(pixmap.width() * visible_scale)
+        if new_size < 1:
+            return None
+        
+        # Shrinking orbs reuse a copy cached at the nearest tenth of full size
+        # (tier 0 is the full-size pixmap); the size cheat's larger scales and
+        # slivers below half a tier are scaled per call as before
+        tier = 0
+        if visible_scale < 1.0:
+            tier = int(visible_scale * SCALE_TIERS + 0.5)
+            if tier == SCALE_TIERS:
+                return pixmap
+            if tier:
+                scaled = self.cache.find(orb_type, radius, pulse_frame, tier)
+                if scaled is not None:
+                    return scaled
+                new_size = max(1, pixmap.width() * tier // SCALE_TIERS)
+        
+        scaled = pixmap.scaled(
+            new_size, new_size,
+            Qt.KeepAspectRatio,
+            Qt.SmoothTransformation
+        )
+        if tier:
+            self.cache.insert(orb_type, radius, pulse_frame, scaled, tier)
+        
+        return scaled
     
     def _get_orb_color(self, orb_type):
         """Get RGB color for orb type"""
-        colors = {
-            OrbType.RED: (255, 50, 50),
-            OrbType.BLUE: (50, 100, 255),
-            OrbType.GREEN: (50, 255, 50),
-            OrbType.YELLOW: (255, 255, 50),
-            OrbType.PURPLE: (200, 50, 255),
-            OrbType.RAINBOW: (255, 255, 255),
-            OrbType.BOMB: (40, 40, 40),
-            OrbType.SLOW: (100, 255, 255),
-            OrbType.REVERSE: (255, 100, 255),
-            OrbType.ACCURACY: (255, 255, 255)
-        }
-        return colors.get(orb_type, (255, 255, 255))
+        return Orb.ORB_COLORS.get(orb_type, _DEFAULT_RGB)
     
     def _get_powerup_symbol(self, orb_type):
         """Get symbol for powerup type"""
-        symbols = {
-            OrbType.BOMB: "💣",
-            OrbType.SLOW: "❄️",
-            OrbType.REVERSE: "⏪",
-            OrbType.ACCURACY: "🎯"
-        }
-        return symbols.get(orb_type, "?")
+        return Orb.POWERUP_SYMBOLS.get(orb_type, "?")
     
     def clear_cache(self):
         """Clear all cached pixmaps"""
         self.cache.clear()
+        self._templates.clear()
         print("OrbRenderCache: Cache cleared")
     
     def get_cache_info(self):
@@ -261,11 +363,9 @@ class ExplosionCache:
     """Cache for explosion effects"""
     
     def __init__(self):
-        self.cache = {}
+        self.cache = _PixmapKeys()
         self.explosion_frames = 10
-        print("ExplosionCache: Initializing...")
-        self._prerender_explosions()
-        print(f"ExplosionCache: Cached {len(self.cache)} explosion frames")
+        self.base_radius = 15
     
     def _prerender_explosions(self):
         """Pre-render explosion frames"""
@@ -277,14 +377,13 @@ class ExplosionCache:
         
         for orb_type in explosion_types:
             for frame in range(self.explosion_frames):
-                self._render_explosion(orb_type, 15, frame)
+                self._render_explosion(orb_type, self.base_radius, frame)
     
     def _render_explosion(self, orb_type, base_radius, frame):
         """Render single explosion frame"""
-        cache_key = (orb_type, frame)
-        
-        if cache_key in self.cache:
-            return self.cache[cache_key]
+        pixmap = self.cache.find(orb_type, base_radius, frame)
+        if pixmap is not None:
+            return pixmap
         
         progress = frame / self.explosion_frames
         
@@ -301,26 +400,29 @@ class ExplosionCache:
         
         center = QPointF(size / 2, size / 2)
         
+        base_color = _EXPLOSION_QCOLOR.get(orb_type, _DEFAULT_QCOLOR)
+        ring_alpha = int(200 * (1 - progress)) / 255
+        
         # Draw explosion rings
-        for i in range(3):
-            radius = explosion_radius * (1 - i * 0.3)
-            gradient = QRadialGradient(center, radius)
+        gradient = QRadialGradient(center, explosion_radius)
+        for stop in _EXPLOSION_STOPS:
+            # Alpha of the rings that still reach this far, painted over each other
+            transparency = 1.0
+            for ring in _EXPLOSION_RING_SCALES:
+                if stop < ring:
+                    transparency *= 1 - ring_alpha * (1 - stop / ring)
             
-            color_rgb = self._get_explosion_color(orb_type)
-            explosion_color = QColor(*color_rgb)
-            explosion_color.setAlpha(int(200 * (1 - progress)))
-            gradient.setColorAt(0, explosion_color)
-            
-            explosion_color.setAlpha(0)
-            gradient.setColorAt(1, explosion_color)
-            
-            painter.setBrush(gradient)
-            painter.setPen(Qt.NoPen)
-            painter.drawEllipse(center, radius, radius)
+            explosion_color = QColor(base_color)
+            explosion_color.setAlphaF(1 - transparency)
+            gradient.setColorAt(stop, explosion_color)
+        
+        painter.setBrush(gradient)
+        painter.setPen(Qt.NoPen)
+        painter.drawEllipse(center, explosion_radius, explosion_radius)
         
         painter.end()
         
-        self.cache[cache_key] = pixmap
+        self.cache.insert(orb_type, base_radius, frame, pixmap)
         return pixmap
     
     def get_explosion_pixmap(self, orb_type, explosion_progress):
@@ -328,20 +430,11 @@ class ExplosionCache:
         frame = int(explosion_progress * self.explosion_frames)
         frame = min(frame, self.explosion_frames - 1)
         
-        cache_key = (orb_type, frame)
-        return self.cache.get(cache_key)
+        return self._render_explosion(orb_type, self.base_radius, frame)
     
     def _get_explosion_color(self, orb_type):
         """Get color for explosion"""
-        colors = {
-            OrbType.RED: (255, 50, 50),
-            OrbType.BLUE: (50, 100, 255),
-            OrbType.GREEN: (50, 255, 50),
-            OrbType.YELLOW: (255, 255, 50),
-            OrbType.PURPLE: (200, 50, 255),
-            OrbType.BOMB: (255, 100, 0)
-        }
-        return colors.get(orb_type, (255, 255, 255))
+        return _EXPLOSION_COLOR_RGB.get(orb_type, _DEFAULT_RGB)
 
 
 # Global explosion cache
@@ -359,11 +452,9 @@ class TrailCache:
     """Cache for projectile trail effects"""
     
     def __init__(self):
-        self.cache = {}
+        self.cache = _PixmapKeys()
         self.trail_steps = 10
-        print("TrailCache: Initializing...")
-        self._prerender_trails()
-        print(f"TrailCache: Cached {len(self.cache)} trail segments")
+        self.base_radius = 12
     
     def _prerender_trails(self):
         """Pre-render trail segments"""
@@ -374,21 +465,20 @@ class TrailCache:
         
         for orb_type in trail_types:
             for step in range(self.trail_steps):
-                self._render_trail(orb_type, 12, step)
+                self._render_trail(orb_type, self.base_radius, step)
     
     def _render_trail(self, orb_type, base_radius, step):
         """Render single trail segment"""
-        cache_key = (orb_type, step)
-        
-        if cache_key in self.cache:
-            return self.cache[cache_key]
-        
         alpha = int(255 * (step / self.trail_steps))
         radius = base_radius * (step / self.trail_steps)
         
         if radius < 1:
             return None
         
+        pixmap = self.cache.find(orb_type, base_radius, step)
+        if pixmap is not None:
+            return pixmap
+        
         size = int(radius * 4)
         pixmap = QPixmap(size, size)
         pixmap.fill(Qt.transparent)
@@ -398,8 +488,7 @@ class TrailCache:
         
         center = QPointF(size / 2, size / 2)
         
-        color_rgb = self._get_trail_color(orb_type)
-        color = QColor(*color_rgb)
+        color = QColor(_TRAIL_QCOLOR.get(orb_type, _DEFAULT_QCOLOR))
         color.setAlpha(alpha)
         
         gradient = QRadialGradient(center, radius)
@@ -413,7 +502,7 @@ class TrailCache:
         
         painter.end()
         
-        self.cache[cache_key] = pixmap
+        self.cache.insert(orb_type, base_radius, step, pixmap)
         return pixmap
     
     def get_trail_pixmap(self, orb_type, progress):
@@ -421,20 +510,11 @@ class TrailCache:
         step = int(progress * self.trail_steps)
         step = min(step, self.trail_steps - 1)
         
-        cache_key = (orb_type, step)
-        return self.cache.get(cache_key)
+        return self._render_trail(orb_type, self.base_radius, step)
     
     def _get_trail_color(self, orb_type):
         """Get color for trail"""
-        colors = {
-            OrbType.RED: (255, 50, 50),
-            OrbType.BLUE: (50, 100, 255),
-            OrbType.GREEN: (50, 255, 50),
-            OrbType.YELLOW: (255, 255, 50),
-            OrbType.PURPLE: (200, 50, 255),
-            OrbType.RAINBOW: (255, 255, 255)
-        }
-        return colors.get(orb_type, (255, 255, 255))
+        return _TRAIL_COLOR_RGB.get(orb_type, _DEFAULT_RGB)
 
 
 # Global trail cache
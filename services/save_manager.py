@@ -2,11 +2,13 @@
 Save and load game state management using JSON in Local AppData
 """
 
-import json
+import functools
 import os
 import sys
 from pathlib import Path
 
+import orjson
+
 class SaveManager:
     """Manages game save/load operations"""
     
@@ -21,8 +23,10 @@ class SaveManager:
         except Exception as e:
             print(f"SaveManager: Error creating directory {e}")
         
-    def _get_save_directory(self):
-        """Get platform-specific local save directory"""
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def _get_save_directory():
+        """Get platform-specific local save directory (resolved once per process)"""
         app_name = "MacanAncient"
         
         if os.name == 'nt':  # Windows
@@ -49,11 +53,14 @@ class SaveManager:
         return home / ".local" / "share" / app_name
         
     def save_game(self, game_data):
-        """Save game data to JSON file"""
+        """Save game data to JSON file (atomic replace)"""
+        tmp_file = self.save_file.with_suffix('.json.tmp')
         try:
-            with open(self.save_file, 'w') as f:
-                json.dump(game_data, f, indent=4)
-            print(f"SaveManager: Game saved to {self.save_file}")
+            with open(tmp_file, 'wb') as f:
+                f.write(orjson.dumps(game_data, option=orjson.OPT_INDENT_2))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, self.save_file)
             return True
         except Exception as e:
             print(f"Error saving game: {e}")
@@ -63,8 +70,7 @@ class SaveManager:
         """Load game data from JSON file"""
         try:
             if self.save_file.exists():
-                with open(self.save_file, 'r') as f:
-                    return json.load(f)
+                return orjson.loads(self.save_file.read_bytes())
         except Exception as e:
             print(f"Error loading game: {e}")
         return None
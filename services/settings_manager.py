@@ -3,18 +3,25 @@ Game settings management using JSON in Local AppData
 UPDATED: Added factory_reset feature
 """
 
-import json
+import atexit
+import functools
 import os
 import sys
 import shutil  
 from pathlib import Path
 
+import orjson
+from PySide6.QtCore import QCoreApplication, QTimer
+
+SETTINGS_FLUSH_DELAY_MS = 500  # Coalesce writes from e.g. a dragged volume slider
+
 class SettingsManager:
     """Manages game settings"""
     
     def __init__(self):
         self.settings_dir = self._get_settings_directory()
         self.settings_file = self.settings_dir / "settings.json"
+        self.volatile_file = self.settings_dir / "state.json"
         
         # Default settings
         self.settings = {
@@ -23,7 +30,12 @@ class SettingsManager:
             'sfx_enabled': True,
             'sfx_volume': 0.8,
             'fullscreen': True,
-            'show_fps': False,
+            'show_fps': False
+        }
+        
+        # Values that change during play live in their own small file, so
+        # updating them doesn't rewrite the whole settings document
+        self.volatile = {
             'high_score': 0
         }
         
@@ -33,11 +45,22 @@ class SettingsManager:
         except Exception as e:
             print(f"SettingsManager: Error creating directory {e}")
         
+        # set() only marks settings dirty; the timer writes them once things settle
+        self._dirty = False
+        self._volatile_dirty = False
+        self._flush_timer = QTimer()
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(SETTINGS_FLUSH_DELAY_MS)
+        self._flush_timer.timeout.connect(self.flush)
+        atexit.register(self.flush)  # The timer never fires after the event loop ends
+        
         # Load settings
         self.load_settings()
         
-    def _get_settings_directory(self):
-        """Get platform-specific local settings directory"""
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def _get_settings_directory():
+        """Get platform-specific local settings directory (resolved once per process)"""
         app_name = "MacanAncient"
         
         if os.name == 'nt':  # Windows
@@ -60,35 +83,92 @@ class SettingsManager:
         return home / ".local" / "share" / app_name
         
     def save_settings(self):
-        """Save settings to JSON file"""
+        """Save settings to JSON file (atomic replace)"""
+        self._dirty = False
         try:
             # Pastikan folder ada sebelum menyimpan
             if not self.settings_dir.exists():
                 self.settings_dir.mkdir(parents=True, exist_ok=True)
-                
-            with open(self.settings_file, 'w') as f:
-                json.dump(self.settings, f, indent=4)
+            
+            self._write_file(
+                self.settings_file,
+                orjson.dumps(self.settings, option=orjson.OPT_INDENT_2)
+            )
             return True
         except Exception as e:
             print(f"Error saving settings: {e}")
             return False
+    
+    def save_volatile(self):
+        """Save volatile state (high score) to its own compact JSON file"""
+        self._volatile_dirty = False
+        try:
+            if not self.settings_dir.exists():
+                self.settings_dir.mkdir(parents=True, exist_ok=True)
+            
+            self._write_file(self.volatile_file, orjson.dumps(self.volatile))
+            return True
+        except Exception as e:
+            print(f"Error saving state: {e}")
+            return False
+    
+    @staticmethod
+    def _write_file(path, data):
+        """Write bytes to a temp file and atomically replace path with it"""
+        tmp_file = path.with_suffix('.json.tmp')
+        with open(tmp_file, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, path)
             
     def load_settings(self):
-        """Load settings from JSON file"""
+        """Load settings and volatile state from their JSON files"""
         try:
             if self.settings_file.exists():
-                with open(self.settings_file, 'r') as f:
-                    loaded = json.load(f)
-                    self.settings.update(loaded)
+                loaded = orjson.loads(self.settings_file.read_bytes())
+                # Older settings.json files still carry the volatile keys
+                for key in self.volatile:
+                    if key in loaded:
+                        self.volatile[key] = loaded.pop(key)
+                self.settings.update(loaded)
         except Exception as e:
             print(f"Error loading settings: {e}")
+        
+        try:
+            if self.volatile_file.exists():
+                self.volatile.update(orjson.loads(self.volatile_file.read_bytes()))
+            elif self.volatile['high_score']:
+                # Migrated from an old settings.json: keep it once that is rewritten
+                self.save_volatile()
+        except Exception as e:
+            print(f"Error loading state: {e}")
             
     def get(self, key, default=None):
+        if key in self.volatile:
+            return self.volatile[key]
         return self.settings.get(key, default)
         
     def set(self, key, value):
-        self.settings[key] = value
-        self.save_settings()
+        if key in self.volatile:
+            self.volatile[key] = value
+            self._volatile_dirty = True
+        else:
+            self.settings[key] = value
+            self._dirty = True
+        
+        if QCoreApplication.instance() is None:
+            self.flush()  # No event loop to run the timer, write right away
+        else:
+            self._flush_timer.start()  # Restarting resets the countdown
+    
+    def flush(self):
+        """Write pending setting changes now"""
+        self._flush_timer.stop()
+        if self._dirty:
+            self.save_settings()
+        if self._volatile_dirty:
+            self.save_volatile()
 
     def factory_reset(self):
         """
@@ -96,6 +176,11 @@ class SettingsManager:
         Returns True if successful.
         """
         try:
+            # Drop any pending write so it can't recreate settings/state.json
+            self._flush_timer.stop()
+            self._dirty = False
+            self._volatile_dirty = False
+            
             print(f"Factory Reset: Deleting {self.settings_dir}...")
             if self.settings_dir.exists():
                 # Hapus seluruh folder dan isinya
@@ -105,6 +190,7 @@ class SettingsManager:
             self.settings_dir.mkdir(parents=True, exist_ok=True)
             
             # Reset variable settings ke default di memori
+            atexit.unregister(self.flush)  # __init__ registers it again
             self.__init__() 
             
             print("Factory Reset: Success.")
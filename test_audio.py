@@ -3,9 +3,8 @@ Test script to verify audio system
 Run this before starting the game to test audio
 """
 
+import os
 import sys
-from PySide6.QtWidgets import QApplication, QWidget, QPushButton, QVBoxLayout, QLabel
-from PySide6.QtCore import Qt
 from pathlib import Path
 
 # Test if audio files exist
@@ -16,12 +15,20 @@ def check_audio_files():
     print("AUDIO FILES CHECK")
     print("="*50)
     
-    if not audio_path.exists():
+    abs_path = audio_path.absolute()
+    
+    # One directory listing gives existence and size of every file
+    # (normcase keeps the lookup case-insensitive on Windows, like exists())
+    try:
+        with os.scandir(abs_path) as it:
+            sizes = {os.path.normcase(entry.name): entry.stat().st_size
+                     for entry in it if entry.is_file()}
+    except (FileNotFoundError, NotADirectoryError):
         print(f"❌ ERROR: 'ancient_sfx' folder not found!")
-        print(f"   Please create folder at: {audio_path.absolute()}")
+        print(f"   Please create folder at: {abs_path}")
         return False
     
-    print(f"✓ Found audio folder: {audio_path.absolute()}\n")
+    print(f"✓ Found audio folder: {abs_path}\n")
     
     required_files = {
         'ancient_bgm.mp3': 'Background Music',
@@ -34,9 +41,9 @@ def check_audio_files():
     
     all_found = True
     for filename, description in required_files.items():
-        filepath = audio_path / filename
-        if filepath.exists():
-            size = filepath.stat().st_size / 1024  # KB
+        size = sizes.get(os.path.normcase(filename))
+        if size is not None:
+            size /= 1024  # KB
             print(f"✓ {filename:20s} ({description:20s}) - {size:.1f} KB")
         else:
             print(f"❌ {filename:20s} ({description:20s}) - NOT FOUND")
@@ -45,132 +52,12 @@ def check_audio_files():
     print("="*50 + "\n")
     return all_found
 
-class AudioTestWindow(QWidget):
-    def __init__(self):
-        super().__init__()
-        self.setWindowTitle("Ancient Tiger - Audio Test")
-        self.setMinimumSize(400, 500)
-        
-        layout = QVBoxLayout()
-        
-        # Title
-        title = QLabel("🔊 Audio System Test")
-        title.setStyleSheet("font-size: 24px; font-weight: bold; color: #FFD700;")
-        title.setAlignment(Qt.AlignCenter)
-        layout.addWidget(title)
-        
-        # Info
-        info = QLabel("Click buttons to test each sound")
-        info.setAlignment(Qt.AlignCenter)
-        layout.addWidget(info)
-        
-        layout.addSpacing(20)
-        
-        # Initialize audio manager
-        try:
-            from services.settings_manager import SettingsManager
-            from audio.audio_manager import AudioManager
-            
-            self.settings_manager = SettingsManager()
-            self.audio_manager = AudioManager(self.settings_manager)
-            
-            status_label = QLabel("✓ Audio Manager Initialized")
-            status_label.setStyleSheet("color: green; font-weight: bold;")
-            status_label.setAlignment(Qt.AlignCenter)
-            layout.addWidget(status_label)
-            
-        except Exception as e:
-            status_label = QLabel(f"❌ Error: {str(e)}")
-            status_label.setStyleSheet("color: red; font-weight: bold;")
-            status_label.setAlignment(Qt.AlignCenter)
-            layout.addWidget(status_label)
-            self.audio_manager = None
-        
-        layout.addSpacing(20)
-        
-        # Test buttons
-        button_style = """
-            QPushButton {
-                background: #8B4513;
-                color: white;
-                border: 2px solid #FFD700;
-                border-radius: 5px;
-                padding: 10px;
-                font-size: 14px;
-            }
-            QPushButton:hover {
-                background: #A0522D;
-            }
-        """
-        
-        if self.audio_manager:
-            # BGM controls
-            bgm_play = QPushButton("▶ Play Background Music")
-            bgm_play.setStyleSheet(button_style)
-            bgm_play.clicked.connect(self.test_bgm_play)
-            layout.addWidget(bgm_play)
-            
-            bgm_pause = QPushButton("⏸ Pause Background Music")
-            bgm_pause.setStyleSheet(button_style)
-            bgm_pause.clicked.connect(self.test_bgm_pause)
-            layout.addWidget(bgm_pause)
-            
-            bgm_stop = QPushButton("⏹ Stop Background Music")
-            bgm_stop.setStyleSheet(button_style)
-            bgm_stop.clicked.connect(self.test_bgm_stop)
-            layout.addWidget(bgm_stop)
-            
-            layout.addSpacing(10)
-            
-            # SFX buttons
-            sfx_buttons = [
-                ("🎯 Test Shoot Sound", self.test_shoot),
-                ("💥 Test Match Sound", self.test_match),
-                ("🔥 Test Combo Sound", self.test_combo),
-                ("⚡ Test Power Sound", self.test_power),
-                ("☠️ Test Game Over Sound", self.test_gameover),
-            ]
-            
-            for text, callback in sfx_buttons:
-                btn = QPushButton(text)
-                btn.setStyleSheet(button_style)
-                btn.clicked.connect(callback)
-                layout.addWidget(btn)
-        
-        self.setLayout(layout)
-        self.setStyleSheet("background-color: #2C1810;")
-    
-    def test_bgm_play(self):
-        print("\n▶ Testing BGM Play...")
-        self.audio_manager.play_bgm()
-    
-    def test_bgm_pause(self):
-        print("\n⏸ Testing BGM Pause...")
-        self.audio_manager.pause_bgm()
-    
-    def test_bgm_stop(self):
-        print("\n⏹ Testing BGM Stop...")
-        self.audio_manager.stop_bgm()
-    
-    def test_shoot(self):
-        print("\n🎯 Testing Shoot Sound...")
-        self.audio_manager.play_shoot()
-    
-    def test_match(self):
-        print("\n💥 Testing Match Sound...")
-        self.audio_manager.play_match()
-    
-    def test_combo(self):
-        print("\n🔥 Testing Combo Sound...")
-        self.audio_manager.play_combo()
-    
-    def test_power(self):
-        print("\n⚡ Testing Power Sound...")
-        self.audio_manager.play_power()
-    
-    def test_gameover(self):
-        print("\n☠️ Testing Game Over Sound...")
-        self.audio_manager.play_game_over()
+def __getattr__(name):
+    # AudioTestWindow lives in _audio_test_window so importing this file doesn't load Qt
+    if name == 'AudioTestWindow':
+        from _audio_test_window import AudioTestWindow
+        return AudioTestWindow
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 def main():
     # First check if files exist
@@ -193,7 +80,10 @@ def main():
         if response.lower() != 'y':
             return
     
-    # Show test window
+    # Show test window (Qt is only loaded from here on)
+    from PySide6.QtWidgets import QApplication
+    from _audio_test_window import AudioTestWindow
+    
     app = QApplication(sys.argv)
     window = AudioTestWindow()
     window.show()
@@ -0,0 +1,15 @@
+"""
+Shared QFont instances for the UI widgets
+"""
+
+import functools
+
+from PySide6.QtGui import QFont
+
+
+@functools.lru_cache(maxsize=64)
+def font(family, size, weight=None):
+    """Return a cached QFont (QFont is implicitly shared, safe to reuse)"""
+    if weight is None:
+        return QFont(family, size)
+    return QFont(family, size, weight)
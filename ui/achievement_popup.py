@@ -3,9 +3,12 @@ Achievement unlock notification popup
 """
 
 from PySide6.QtWidgets import QWidget, QLabel, QHBoxLayout, QVBoxLayout
-from PySide6.QtCore import Qt, QTimer, QPropertyAnimation, QEasingCurve, QPoint
+from PySide6.QtCore import (Qt, QPropertyAnimation, QSequentialAnimationGroup,
+                           QEasingCurve, QPoint)
 from PySide6.QtGui import QPainter, QColor, QFont, QLinearGradient
 
+from ui._fonts import font
+
 class AchievementPopup(QWidget):
     """Achievement unlock notification that slides in from top"""
     
@@ -22,6 +25,27 @@ class AchievementPopup(QWidget):
         
         self.setup_ui()
         
+        # Paint resources; the popup has a fixed size so they never change
+        self._bg_gradient = QLinearGradient(0, 0, 0, self.height())
+        self._bg_gradient.setColorAt(0, QColor(139, 69, 19, 240))
+        self._bg_gradient.setColorAt(1, QColor(101, 67, 33, 240))
+        self._border_pen = QColor(255, 215, 0, 255)
+        
+        # Slide in -> stay 4 seconds -> slide out, driven by one group
+        self.slide_in = QPropertyAnimation(self, b"pos")
+        self.slide_in.setDuration(500)
+        self.slide_in.setEasingCurve(QEasingCurve.OutBounce)
+        
+        self.slide_out = QPropertyAnimation(self, b"pos")
+        self.slide_out.setDuration(300)
+        self.slide_out.setEasingCurve(QEasingCurve.InBack)
+        
+        self.animation = QSequentialAnimationGroup(self)
+        self.animation.addAnimation(self.slide_in)
+        self.animation.addPause(4000)
+        self.animation.addAnimation(self.slide_out)
+        self.animation.finished.connect(self.close)
+        
     def setup_ui(self):
         """Setup popup UI"""
         self.setFixedSize(400, 100)
@@ -32,7 +56,7 @@ class AchievementPopup(QWidget):
         
         # Icon
         icon_label = QLabel(self.icon)
-        icon_label.setFont(QFont("Arial", 36))
+        icon_label.setFont(font("Arial", 36))
         icon_label.setFixedSize(60, 60)
         icon_label.setAlignment(Qt.AlignCenter)
         icon_label.setStyleSheet("color: #FFD700;")
@@ -43,17 +67,17 @@ class AchievementPopup(QWidget):
         text_layout.setSpacing(5)
         
         header = QLabel("🏆 ACHIEVEMENT UNLOCKED!")
-        header.setFont(QFont("Arial", 10, QFont.Bold))
+        header.setFont(font("Arial", 10, QFont.Bold))
         header.setStyleSheet("color: #FFD700;")
         text_layout.addWidget(header)
         
         name_label = QLabel(self.name)
-        name_label.setFont(QFont("Arial", 14, QFont.Bold))
+        name_label.setFont(font("Arial", 14, QFont.Bold))
         name_label.setStyleSheet("color: #FFFFFF;")
         text_layout.addWidget(name_label)
         
         desc_label = QLabel(self.description)
-        desc_label.setFont(QFont("Arial", 10))
+        desc_label.setFont(font("Arial", 10))
         desc_label.setStyleSheet("color: #CCCCCC;")
         desc_label.setWordWrap(True)
         text_layout.addWidget(desc_label)
@@ -67,50 +91,39 @@ class AchievementPopup(QWidget):
         painter = QPainter(self)
         painter.setRenderHint(QPainter.Antialiasing)
         
-        # Background gradient
-        gradient = QLinearGradient(0, 0, 0, self.height())
-        gradient.setColorAt(0, QColor(139, 69, 19, 240))
-        gradient.setColorAt(1, QColor(101, 67, 33, 240))
-        
-        painter.setBrush(gradient)
-        painter.setPen(QColor(255, 215, 0, 255))
+        painter.setBrush(self._bg_gradient)
+        painter.setPen(self._border_pen)
         painter.drawRoundedRect(0, 0, self.width(), self.height(), 10, 10)
         
     def show_notification(self, parent_widget):
         """Show notification with animation"""
+        target_y = 20  # Final position from top
         if parent_widget:
             # Position at top center of parent
             x = (parent_widget.width() - self.width()) // 2
             y = -self.height()  # Start above screen
             
-            self.move(parent_widget.mapToGlobal(QPoint(x, y)))
-        
-        self.show()
-        
-        # Slide in animation
-        self.slide_animation = QPropertyAnimation(self, b"pos")
-        self.slide_animation.setDuration(500)
-        self.slide_animation.setStartValue(self.pos())
-        
-        target_y = 20  # Final position from top
-        if parent_widget:
-            target_pos = parent_widget.mapToGlobal(QPoint(x, target_y))
+            start_pos = parent_widget.mapToGlobal(QPoint(x, y))
+            target_pos = start_pos + QPoint(0, target_y - y)
+            self.move(start_pos)
         else:
-            target_pos = QPoint(self.pos().x(), target_y)
+            start_pos = self.pos()
+            target_pos = QPoint(start_pos.x(), target_y)
         
-        self.slide_animation.setEndValue(target_pos)
-        self.slide_animation.setEasingCurve(QEasingCurve.OutBounce)
-        self.slide_animation.start()
+        self.show()
         
-        # Auto hide after 4 seconds
-        QTimer.singleShot(4000, self.hide_notification)
+        self.animation.stop()
+        self.slide_in.setStartValue(start_pos)
+        self.slide_in.setEndValue(target_pos)
+        self.slide_out.setStartValue(target_pos)
+        self.slide_out.setEndValue(QPoint(target_pos.x(), -self.height()))
+        self.animation.start()
         
     def hide_notification(self):
-        """Hide notification with animation"""
-        self.slide_animation = QPropertyAnimation(self, b"pos")
-        self.slide_animation.setDuration(300)
-        self.slide_animation.setStartValue(self.pos())
-        self.slide_animation.setEndValue(QPoint(self.pos().x(), -self.height()))
-        self.slide_animation.setEasingCurve(QEasingCurve.InBack)
-        self.slide_animation.finished.connect(self.close)
-        self.slide_animation.start()
\ No newline at end of file
+        """Hide notification early (jump to the slide out)"""
+        slide_out_start = self.animation.duration() - self.slide_out.duration()
+        if self.animation.currentTime() < slide_out_start:
+            # pause/resume re-arms Qt's pause timer at the new position
+            self.animation.pause()
+            self.animation.setCurrentTime(slide_out_start)
+            self.animation.resume()
\ No newline at end of file
@@ -2,10 +2,177 @@
 Achievement viewer UI - displays all achievements with progress
 """
 
+from bisect import bisect_left
+
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QScrollArea,
-                                QLabel, QPushButton, QFrame, QProgressBar)
-from PySide6.QtCore import Qt, Signal, QTimer
-from PySide6.QtGui import QPainter, QColor, QLinearGradient, QFont
+                                QLabel, QPushButton, QProgressBar)
+from PySide6.QtCore import Qt, Signal, QTimer, QRectF, QPointF, QSize
+from PySide6.QtGui import (QPainter, QColor, QLinearGradient, QGradient, QFont,
+                           QPen, QBrush, QPixmap)
+
+from ui._fonts import font
+
+# All hidden + locked achievements look the same, so they share one row
+_HIDDEN_ROW = {
+    'icon': "🔒",
+    'name': "???",
+    'description': "Hidden achievement",
+    'unlocked': False
+}
+
+
+class AchievementListWidget(QWidget):
+    """All achievement rows painted by one widget (no per-row child widgets)"""
+    
+    MARGIN = 10
+    SPACING = 15
+    CATEGORY_HEIGHT = 40
+    ROW_HEIGHT = 90
+    PADDING = 15
+    ICON_SIZE = 60
+    STATUS_WIDTH = 130
+    
+    def __init__(self, rows, parent=None):
+        super().__init__(parent)
+        
+        self.category_font = font("Arial", 16, QFont.Bold)
+        self.icon_font = font("Arial", 32)
+        self.name_font = font("Arial", 14, QFont.Bold)
+        self.desc_font = font("Arial", 11)
+        self.status_fonts = {
+            True: font("Arial", 12, QFont.Bold),
+            False: font("Arial", 12)
+        }
+        
+        unlocked_gradient = QLinearGradient(0, 0, 1, 0)
+        unlocked_gradient.setCoordinateMode(QGradient.ObjectMode)
+        unlocked_gradient.setColorAt(0, QColor(139, 69, 19, 200))
+        unlocked_gradient.setColorAt(1, QColor(101, 67, 33, 200))
+        self.frame_brushes = {
+            True: QBrush(unlocked_gradient),
+            False: QBrush(QColor(50, 50, 50, 150))
+        }
+        self.frame_pens = {
+            True: QPen(QColor("#FFD700"), 2),
+            False: QPen(QColor("#555555"), 2)
+        }
+        self.name_colors = {True: QColor("#FFD700"), False: QColor("#888888")}
+        self.desc_colors = {True: QColor("#FFA500"), False: QColor("#666666")}
+        self.status_colors = {True: QColor("#00FF00"), False: QColor("#888888")}
+        self.status_texts = {True: "✓ UNLOCKED", False: "🔒 LOCKED"}
+        self.category_color = QColor("#FFA500")
+        self.icon_color = QColor("#FFFFFF")
+        self._hidden_card = None  # pre-painted _HIDDEN_ROW card
+        
+        self.set_rows(rows)
+    
+    def set_rows(self, rows):
+        """Set rows: {'category': name} headers or achievement dicts"""
+        self.rows = []  # (top, height, row)
+        self.row_bottoms = []  # bisected to find the first visible row
+        y = self.MARGIN
+        for row in rows:
+            height = self.CATEGORY_HEIGHT if 'category' in row else self.ROW_HEIGHT
+            self.rows.append((y, height, row))
+            self.row_bottoms.append(y + height)
+            y += height + self.SPACING
+        
+        self.total_height = y - self.SPACING + self.MARGIN
+        self.setMinimumHeight(self.total_height)
+        self.updateGeometry()
+        self.update()
+    
+    def sizeHint(self):
+        return QSize(self.width(), self.total_height)
+    
+    def paintEvent(self, event):
+        """Paint only the rows inside the exposed area"""
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        
+        clip = event.rect()
+        width = self.width() - self.MARGIN * 2
+        
+        first = bisect_left(self.row_bottoms, clip.top())
+        for top, height, row in self.rows[first:]:
+            if top > clip.bottom():
+                break
+            
+            if 'category' in row:
+                painter.setFont(self.category_font)
+                painter.setPen(self.category_color)
+                painter.drawText(
+                    QRectF(self.MARGIN, top, width, height),
+                    Qt.AlignLeft | Qt.AlignVCenter,
+                    f"📂 {row['category'].upper()}"
+                )
+            elif row is _HIDDEN_ROW:
+                painter.drawPixmap(QPointF(self.MARGIN, top), self._get_hidden_card(width, height))
+            else:
+                self._paint_achievement(painter, QRectF(self.MARGIN, top, width, height), row)
+    
+    def _get_hidden_card(self, width, height):
+        """Hidden achievement card, painted once per width"""
+        dpr = self.devicePixelRatioF()
+        card = self._hidden_card
+        if (card is None or card.devicePixelRatio() != dpr
+                or card.deviceIndependentSize().toSize() != QSize(width, height)):
+            card = QPixmap(round(width * dpr), round(height * dpr))
+            card.setDevicePixelRatio(dpr)
+            card.fill(Qt.transparent)
+            painter = QPainter(card)
+            painter.setRenderHint(QPainter.Antialiasing)
+            self._paint_achievement(painter, QRectF(0, 0, width, height), _HIDDEN_ROW)
+            painter.end()
+            self._hidden_card = card
+        return card
+    
+    def _paint_achievement(self, painter, rect, row):
+        """Paint one achievement card"""
+        unlocked = row['unlocked']
+        
+        painter.setBrush(self.frame_brushes[unlocked])
+        painter.setPen(self.frame_pens[unlocked])
+        painter.drawRoundedRect(rect.adjusted(1, 1, -1, -1), 8, 8)
+        
+        # Icon
+        icon_rect = QRectF(
+            rect.left() + self.PADDING,
+            rect.top() + (rect.height() - self.ICON_SIZE) / 2,
+            self.ICON_SIZE, self.ICON_SIZE
+        )
+        painter.setFont(self.icon_font)
+        painter.setPen(self.icon_color)
+        painter.drawText(icon_rect, Qt.AlignCenter, row['icon'])
+        
+        # Status
+        status_rect = QRectF(
+            rect.right() - self.PADDING - self.STATUS_WIDTH, rect.top(),
+            self.STATUS_WIDTH, rect.height()
+        )
+        painter.setFont(self.status_fonts[unlocked])
+        painter.setPen(self.status_colors[unlocked])
+        painter.drawText(status_rect, Qt.AlignRight | Qt.AlignVCenter, self.status_texts[unlocked])
+        
+        # Name and description
+        text_left = icon_rect.right() + self.PADDING
+        text_width = status_rect.left() - self.PADDING - text_left
+        painter.setFont(self.name_font)
+        name_height = painter.fontMetrics().height() + 8
+        painter.setPen(self.name_colors[unlocked])
+        painter.drawText(
+            QRectF(text_left, rect.top() + self.PADDING, text_width, name_height),
+            Qt.AlignLeft | Qt.AlignVCenter, row['name']
+        )
+        
+        painter.setFont(self.desc_font)
+        painter.setPen(self.desc_colors[unlocked])
+        desc_top = rect.top() + self.PADDING + name_height
+        painter.drawText(
+            QRectF(text_left, desc_top, text_width, rect.bottom() - self.PADDING + 5 - desc_top),
+            Qt.AlignLeft | Qt.AlignTop | Qt.TextWordWrap, row['description']
+        )
+
 
 class AchievementViewer(QWidget):
     """Achievement viewer with categorized display"""
@@ -18,9 +185,21 @@ class AchievementViewer(QWidget):
         
         self.setWindowFlags(Qt.FramelessWindowHint | Qt.Window)
         self.setAttribute(Qt.WA_StyledBackground, True)
+        # MainMenu opens a new viewer every time, so delete it once closed
+        self.setAttribute(Qt.WA_DeleteOnClose, True)
+        
+        # Background gradient in object coordinates, so it fits any window height
+        self._bg_gradient = QLinearGradient(0, 0, 0, 1)
+        self._bg_gradient.setCoordinateMode(QGradient.ObjectMode)
+        self._bg_gradient.setColorAt(0, QColor(20, 10, 25))
+        self._bg_gradient.setColorAt(1, QColor(10, 5, 15))
+        self._bg_pixmap = None  # gradient rendered at the current size
         
         self.setup_ui()
         
+        # Keep progress and rows current if something unlocks while open
+        self.achievement_manager.progress_changed.connect(self._update_progress)
+        
     def setup_ui(self):
         """Setup achievement viewer UI"""
         main_layout = QVBoxLayout()
@@ -31,7 +210,7 @@ class AchievementViewer(QWidget):
         header_layout = QHBoxLayout()
         
         title = QLabel("🏆 ACHIEVEMENTS")
-        title.setFont(QFont("Arial", 32, QFont.Bold))
+        title.setFont(font("Arial", 32, QFont.Bold))
         title.setStyleSheet("color: #FFD700;")
         header_layout.addWidget(title)
         
@@ -39,18 +218,18 @@ class AchievementViewer(QWidget):
         
         # Progress
         unlocked, total, percent = self.achievement_manager.get_progress()
-        progress_label = QLabel(f"{unlocked}/{total} ({percent:.1f}%)")
-        progress_label.setFont(QFont("Arial", 18, QFont.Bold))
-        progress_label.setStyleSheet("color: #FFA500;")
-        header_layout.addWidget(progress_label)
+        self.progress_label = QLabel(f"{unlocked}/{total} ({percent:.1f}%)")
+        self.progress_label.setFont(font("Arial", 18, QFont.Bold))
+        self.progress_label.setStyleSheet("color: #FFA500;")
+        header_layout.addWidget(self.progress_label)
         
         main_layout.addLayout(header_layout)
         
         # Progress bar
-        progress_bar = QProgressBar()
-        progress_bar.setMaximum(total)
-        progress_bar.setValue(unlocked)
-        progress_bar.setStyleSheet("""
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setMaximum(total)
+        self.progress_bar.setValue(unlocked)
+        self.progress_bar.setStyleSheet("""
             QProgressBar {
                 border: 2px solid #8B4513;
                 border-radius: 5px;
@@ -66,7 +245,7 @@ class AchievementViewer(QWidget):
                 border-radius: 3px;
             }
         """)
-        main_layout.addWidget(progress_bar)
+        main_layout.addWidget(self.progress_bar)
         
         # Scroll area for achievements
         scroll = QScrollArea()
@@ -79,29 +258,8 @@ class AchievementViewer(QWidget):
             }
         """)
         
-        scroll_content = QWidget()
-        scroll_layout = QVBoxLayout(scroll_content)
-        scroll_layout.setSpacing(15)
-        
-        # Display by category
-        categories = self.achievement_manager.get_categories()
-        
-        for category in categories:
-            # Category header
-            cat_label = QLabel(f"📂 {category.upper()}")
-            cat_label.setFont(QFont("Arial", 16, QFont.Bold))
-            cat_label.setStyleSheet("color: #FFA500; padding: 10px 0;")
-            scroll_layout.addWidget(cat_label)
-            
-            # Achievements in this category
-            achievements = self.achievement_manager.get_by_category(category)
-            
-            for ach_id, ach_data in achievements.items():
-                ach_widget = self.create_achievement_widget(ach_id, ach_data)
-                scroll_layout.addWidget(ach_widget)
-        
-        scroll_layout.addStretch()
-        scroll.setWidget(scroll_content)
+        self.achievement_list = AchievementListWidget(self.build_rows())
+        scroll.setWidget(self.achievement_list)
         main_layout.addWidget(scroll)
         
         # Close button
@@ -132,61 +290,40 @@ class AchievementViewer(QWidget):
         
         self.setLayout(main_layout)
     
-    def create_achievement_widget(self, ach_id, ach_data):
-        """Create widget for single achievement"""
-        is_unlocked = self.achievement_manager.is_unlocked(ach_id)
-        is_hidden = ach_data.get('hidden', False) and not is_unlocked
-        
-        frame = QFrame()
-        frame.setStyleSheet(f"""
-            QFrame {{
-                background: {'qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 rgba(139, 69, 19, 200), stop:1 rgba(101, 67, 33, 200))' if is_unlocked else 'rgba(50, 50, 50, 150)'};
-                border: 2px solid {'#FFD700' if is_unlocked else '#555555'};
-                border-radius: 8px;
-                padding: 10px;
-            }}
-        """)
-        
-        layout = QHBoxLayout(frame)
+    def build_rows(self):
+        """Build the category header and achievement rows"""
+        rows = []
         
-        # Icon
-        icon_label = QLabel(ach_data['icon'] if not is_hidden else "🔒")
-        icon_label.setFont(QFont("Arial", 32))
-        icon_label.setFixedSize(60, 60)
-        icon_label.setAlignment(Qt.AlignCenter)
-        layout.addWidget(icon_label)
-        
-        # Info
-        info_layout = QVBoxLayout()
-        
-        name = ach_data['name'] if not is_hidden else "???"
-        name_label = QLabel(name)
-        name_label.setFont(QFont("Arial", 14, QFont.Bold))
-        name_label.setStyleSheet(f"color: {'#FFD700' if is_unlocked else '#888888'};")
-        info_layout.addWidget(name_label)
-        
-        desc = ach_data['description'] if not is_hidden else "Hidden achievement"
-        desc_label = QLabel(desc)
-        desc_label.setFont(QFont("Arial", 11))
-        desc_label.setStyleSheet(f"color: {'#FFA500' if is_unlocked else '#666666'};")
-        desc_label.setWordWrap(True)
-        info_layout.addWidget(desc_label)
-        
-        layout.addLayout(info_layout, 1)
+        for category, achievements in self.achievement_manager.get_grouped():
+            # Category header
+            rows.append({'category': category})
+            
+            # Achievements in this category
+            for ach_id, ach_data in achievements.items():
+                rows.append(self.create_achievement_row(ach_id, ach_data))
         
-        # Status
-        if is_unlocked:
-            status_label = QLabel("✓ UNLOCKED")
-            status_label.setFont(QFont("Arial", 12, QFont.Bold))
-            status_label.setStyleSheet("color: #00FF00;")
-            layout.addWidget(status_label)
-        else:
-            status_label = QLabel("🔒 LOCKED")
-            status_label.setFont(QFont("Arial", 12))
-            status_label.setStyleSheet("color: #888888;")
-            layout.addWidget(status_label)
+        return rows
+    
+    def _update_progress(self, unlocked, total):
+        """Refresh progress widgets and rows in place"""
+        percent = (unlocked / total) * 100 if total else 0
+        self.progress_label.setText(f"{unlocked}/{total} ({percent:.1f}%)")
+        self.progress_bar.setMaximum(total)
+        self.progress_bar.setValue(unlocked)
+        self.achievement_list.set_rows(self.build_rows())
+    
+    def create_achievement_row(self, ach_id, ach_data):
+        """Describe a single achievement row for AchievementListWidget"""
+        is_unlocked = self.achievement_manager.is_unlocked(ach_id)
+        if ach_data.get('hidden', False) and not is_unlocked:
+            return _HIDDEN_ROW
         
-        return frame
+        return {
+            'icon': ach_data['icon'],
+            'name': ach_data['name'],
+            'description': ach_data['description'],
+            'unlocked': is_unlocked
+        }
     
     def show_viewer(self):
         """Show achievement viewer fullscreen"""
@@ -197,14 +334,35 @@ class AchievementViewer(QWidget):
         self.closed.emit()
         self.close()
     
+    def closeEvent(self, event):
+        """Stop listening to the (long-lived) manager before the viewer is deleted"""
+        try:
+            self.achievement_manager.progress_changed.disconnect(self._update_progress)
+        except (RuntimeError, TypeError):
+            pass  # Already disconnected (closed more than once)
+        super().closeEvent(event)
+    
+    def resizeEvent(self, event):
+        """Drop the cached background, it is redrawn at the new size"""
+        self._bg_pixmap = None
+        super().resizeEvent(event)
+    
+    def _get_bg_pixmap(self):
+        """Background gradient rendered once per window size"""
+        dpr = self.devicePixelRatioF()
+        if self._bg_pixmap is None or self._bg_pixmap.devicePixelRatio() != dpr:
+            pixmap = QPixmap(round(self.width() * dpr), round(self.height() * dpr))
+            pixmap.setDevicePixelRatio(dpr)
+            painter = QPainter(pixmap)
+            painter.fillRect(self.rect(), self._bg_gradient)
+            painter.end()
+            self._bg_pixmap = pixmap
+        return self._bg_pixmap
+    
     def paintEvent(self, event):
         """Draw background"""
         painter = QPainter(self)
-        
-        gradient = QLinearGradient(0, 0, 0, self.height())
-        gradient.setColorAt(0, QColor(20, 10, 25))
-        gradient.setColorAt(1, QColor(10, 5, 15))
-        painter.fillRect(self.rect(), gradient)
+        painter.drawPixmap(0, 0, self._get_bg_pixmap())
     
     def keyPressEvent(self, event):
         """Handle ESC to close"""
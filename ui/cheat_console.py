@@ -2,10 +2,26 @@
 Cheat console overlay UI
 """
 
-from PySide6.QtWidgets import QWidget, QVBoxLayout, QLineEdit, QLabel, QScrollArea, QFrame
-from PySide6.QtCore import Qt, Signal, QTimer
+import html
+from collections import deque
+
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QLineEdit, QLabel, QPlainTextEdit, QFrame
+from PySide6.QtCore import Qt, Signal
 from PySide6.QtGui import QPainter, QColor, QFont, QKeyEvent
 
+from ui._fonts import font
+
+# Oldest output lines are dropped past this limit
+MAX_OUTPUT_LINES = 500
+MAX_HISTORY = 200
+
+
+def _line_html(text, color):
+    """Format one output line as a coloured HTML span"""
+    escaped = html.escape(text).replace("\n", "<br>")
+    return f'<span style="color:{color}; white-space:pre-wrap;">{escaped}</span>'
+
+
 class CheatConsole(QWidget):
     """Cheat console overlay"""
     
@@ -19,8 +35,9 @@ class CheatConsole(QWidget):
         self.setWindowFlags(Qt.FramelessWindowHint | Qt.Tool)
         self.setAttribute(Qt.WA_TranslucentBackground)
         
-        self.command_history = []
+        self.command_history = deque(maxlen=MAX_HISTORY)
         self.history_index = -1
+        self._help_html = None  # built on the first HELP
         
         self.setup_ui()
         
@@ -46,23 +63,29 @@ class CheatConsole(QWidget):
         
         # Header
         header = QLabel("🎮 CHEAT CONSOLE")
-        header.setFont(QFont("Consolas", 16, QFont.Bold))
+        header.setFont(font("Consolas", 16, QFont.Bold))
         header.setStyleSheet("color: #FFD700; background: transparent; border: none;")
         header.setAlignment(Qt.AlignCenter)
         console_layout.addWidget(header)
         
         # Help text
         help_text = QLabel("Type 'HELP' to see all cheats | '~' or ESC to close")
-        help_text.setFont(QFont("Consolas", 10))
+        help_text.setFont(font("Consolas", 10))
         help_text.setStyleSheet("color: #888888; background: transparent; border: none;")
         help_text.setAlignment(Qt.AlignCenter)
         console_layout.addWidget(help_text)
         
-        # Output area (scroll)
-        self.scroll_area = QScrollArea()  # Simpan ke self
-        self.scroll_area.setWidgetResizable(True)
-        self.scroll_area.setStyleSheet("""
-            QScrollArea {
+        # Output area, one document for all lines
+        self.output = QPlainTextEdit()
+        self.output.setReadOnly(True)
+        self.output.setMaximumBlockCount(MAX_OUTPUT_LINES)
+        # Monospace ASCII log: skip full text shaping (no ligatures/kerning needed)
+        output_font = QFont(font("Consolas", 10))
+        output_font.setStyleStrategy(QFont.PreferNoShaping)
+        self.output.setFont(output_font)
+        self.output.setFocusPolicy(Qt.NoFocus)
+        self.output.setStyleSheet("""
+            QPlainTextEdit {
                 background: rgba(20, 20, 20, 200);
                 border: 1px solid #555555;
                 border-radius: 5px;
@@ -76,18 +99,11 @@ class CheatConsole(QWidget):
                 border-radius: 5px;
             }
         """)
-        
-        self.output_widget = QWidget()
-        self.output_layout = QVBoxLayout(self.output_widget)
-        self.output_layout.setAlignment(Qt.AlignTop)
-        self.output_layout.setSpacing(5)
-        
-        self.scroll_area.setWidget(self.output_widget) # Gunakan self.scroll_area
-        console_layout.addWidget(self.scroll_area)
+        console_layout.addWidget(self.output)
         
         # Input line
         self.input_line = QLineEdit()
-        self.input_line.setFont(QFont("Consolas", 12))
+        self.input_line.setFont(font("Consolas", 12))
         self.input_line.setStyleSheet("""
             QLineEdit {
                 background: rgba(40, 40, 40, 200);
@@ -131,8 +147,9 @@ class CheatConsole(QWidget):
         if not command:
             return
         
-        # Add to history
-        self.command_history.append(command)
+        # Add to history (skip repeats of the last command, like a shell)
+        if not self.command_history or self.command_history[-1] != command:
+            self.command_history.append(command)
         self.history_index = len(self.command_history)
         
         # Display command
@@ -159,61 +176,54 @@ class CheatConsole(QWidget):
         
     def show_help(self):
         """Show all available cheats"""
-        self.add_output("=== AVAILABLE CHEATS ===", "#FFD700")
+        if self._help_html is None:
+            self._help_html = "".join(
+                f"<p>{_line_html(text, color)}</p>"
+                for text, color in self._build_help_lines()
+            )
+        
+        self.output.appendHtml(self._help_html)
+        self.scroll_to_bottom()
+        
+    def _build_help_lines(self):
+        """Yield (text, color) for every HELP line"""
+        yield "=== AVAILABLE CHEATS ===", "#FFD700"
         
         categories = self.cheat_system.get_all_cheats_by_category()
         
         for category, cheats in sorted(categories.items()):
-            self.add_output(f"\n[{category}]", "#FFA500")
+            yield f"\n[{category}]", "#FFA500"
             for cheat in cheats:
                 code = cheat['code']
                 desc = cheat['description']
                 param = " <param>" if cheat.get('needs_param') else ""
-                self.add_output(f"  {code}{param} - {desc}", "#CCCCCC")
+                yield f"  {code}{param} - {desc}", "#CCCCCC"
         
-        self.add_output("\nOther commands: CLEAR, EXIT", "#888888")
+        yield "\nOther commands: CLEAR, EXIT", "#888888"
         
     def clear_output(self):
         """Clear output area"""
-        while self.output_layout.count():
-            child = self.output_layout.takeAt(0)
-            if child.widget():
-                child.widget().deleteLater()
+        self.output.clear()
         
         self.add_output("Console cleared", "#888888")
         
     def add_output(self, text, color="#FFFFFF"):
         """Add text to output"""
-        label = QLabel(text)
-        label.setFont(QFont("Consolas", 10))
-        label.setStyleSheet(f"color: {color}; background: transparent; border: none;")
-        label.setWordWrap(True)
-        self.output_layout.addWidget(label)
-        
-        # Auto scroll to bottom
-        QTimer.singleShot(10, self.scroll_to_bottom)
+        self.output.appendHtml(_line_html(text, color))
+        self.scroll_to_bottom()
         
     def scroll_to_bottom(self):
         """Scroll output to bottom"""
-        # Jangan pakai parent(), tapi pakai referensi langsung
-        if hasattr(self, 'scroll_area') and self.scroll_area:
-            scrollbar = self.scroll_area.verticalScrollBar()
-            scrollbar.setValue(scrollbar.maximum())
+        scrollbar = self.output.verticalScrollBar()
+        scrollbar.setValue(scrollbar.maximum())
         
     def keyPressEvent(self, event):
         """Handle key press"""
         # History navigation
         if event.key() == Qt.Key_Up:
-            if self.history_index > 0:
-                self.history_index -= 1
-                self.input_line.setText(self.command_history[self.history_index])
+            self.navigate_history(-1)
         elif event.key() == Qt.Key_Down:
-            if self.history_index < len(self.command_history) - 1:
-                self.history_index += 1
-                self.input_line.setText(self.command_history[self.history_index])
-            else:
-                self.history_index = len(self.command_history)
-                self.input_line.clear()
+            self.navigate_history(1)
         
         # Close console
         elif event.key() == Qt.Key_Escape or event.key() == Qt.Key_QuoteLeft:  # ~ key
@@ -222,6 +232,20 @@ class CheatConsole(QWidget):
         else:
             super().keyPressEvent(event)
     
+    def navigate_history(self, delta):
+        """Move through command history; index len(history) is the empty line"""
+        history = self.command_history
+        if not history:
+            return
+        
+        index = max(0, min(len(history), self.history_index + delta))
+        text = history[index] if index < len(history) else ""
+        self.history_index = index
+        
+        # setText relayouts and emits textChanged, skip it when nothing changes
+        if text != self.input_line.text():
+            self.input_line.setText(text)
+    
     def paintEvent(self, event):
         """Draw semi-transparent background"""
         painter = QPainter(self)
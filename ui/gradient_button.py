@@ -0,0 +1,96 @@
+"""
+Menu button with a cached gradient background
+"""
+
+from PySide6.QtWidgets import QPushButton
+from PySide6.QtCore import Qt, QRectF, QSize
+from PySide6.QtGui import QPainter, QColor, QPen, QPixmap, QLinearGradient
+
+TEXT_COLOR = QColor("#FFD700")
+BORDER_WIDTH = 2
+
+# Colours per state: (gradient stop 0, gradient stop 1, border)
+_STATE_COLORS = {
+    "normal": (QColor("#8B4513"), QColor("#654321"), QColor("#FFD700")),
+    "hover": (QColor("#A0522D"), QColor("#8B4513"), QColor("#FFA500")),
+    "pressed": (QColor("#654321"), QColor("#654321"), QColor("#FFA500")),
+}
+
+
+class GradientButton(QPushButton):
+    """QPushButton that blits a pre-rendered gradient instead of styling via QSS"""
+
+    # (state, width, height, radius, dpr) -> QPixmap, shared by every button
+    _background_cache = {}
+
+    def __init__(self, text, parent=None, radius=10, padding=(40, 15), font_size=18,
+                 pressed_state=True):
+        super().__init__(text, parent)
+        self.radius = radius
+        self.padding = padding
+        self.pressed_state = pressed_state
+
+        button_font = self.font()
+        button_font.setPixelSize(font_size)
+        button_font.setBold(True)
+        self.setFont(button_font)
+        self.setAttribute(Qt.WA_Hover)
+
+    def sizeHint(self):
+        """Text size plus padding and border, like the old stylesheet box"""
+        text_size = self.fontMetrics().size(Qt.TextShowMnemonic, self.text())
+        pad_x, pad_y = self.padding
+        return QSize(
+            text_size.width() + 2 * (pad_x + BORDER_WIDTH),
+            text_size.height() + 2 * (pad_y + BORDER_WIDTH)
+        )
+
+    def minimumSizeHint(self):
+        return self.sizeHint()
+
+    def enterEvent(self, event):
+        self.update()
+        super().enterEvent(event)
+
+    def leaveEvent(self, event):
+        self.update()
+        super().leaveEvent(event)
+
+    def _state(self):
+        if self.isDown():
+            return "pressed" if self.pressed_state else "hover"
+        return "hover" if self.underMouse() else "normal"
+
+    def _background(self, state):
+        """Rounded gradient background for this size/state, rendered once"""
+        dpr = self.devicePixelRatioF()
+        key = (state, self.width(), self.height(), self.radius, dpr)
+        pixmap = self._background_cache.get(key)
+        if pixmap is None:
+            pixmap = QPixmap(self.size() * dpr)
+            pixmap.setDevicePixelRatio(dpr)
+            pixmap.fill(Qt.transparent)
+
+            start, end, border = _STATE_COLORS[state]
+            gradient = QLinearGradient(0, 0, self.width(), self.height())
+            gradient.setColorAt(0, start)
+            gradient.setColorAt(1, end)
+
+            painter = QPainter(pixmap)
+            painter.setRenderHint(QPainter.Antialiasing)
+            painter.setPen(QPen(border, BORDER_WIDTH))
+            painter.setBrush(gradient)
+            half = BORDER_WIDTH / 2
+            painter.drawRoundedRect(
+                QRectF(self.rect()).adjusted(half, half, -half, -half),
+                self.radius - half, self.radius - half
+            )
+            painter.end()
+            self._background_cache[key] = pixmap
+        return pixmap
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, self._background(self._state()))
+        painter.setPen(TEXT_COLOR)
+        painter.drawText(self.rect(), Qt.AlignCenter | Qt.TextShowMnemonic, self.text())
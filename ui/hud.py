@@ -2,8 +2,77 @@
 Heads-up display for game information
 """
 
-from PySide6.QtGui import QPainter, QFont, QColor, QPen
-from PySide6.QtCore import Qt, QRectF
+import functools
+import math
+import time
+
+from PySide6.QtGui import (QPainter, QFont, QFontMetrics, QColor, QPen, QPixmap,
+                           QTransform, QStaticText)
+from PySide6.QtCore import Qt, QRectF, QPointF
+
+from ui._fonts import font
+
+# Ruang ekstra di sekitar teks untuk antialiasing + shadow offset
+TEXT_MARGIN = 2
+SHADOW_OFFSET = 2
+
+# Area HUD untuk repaint parsial: kolom status kiri atas dan pita atas
+# (combo / slow-mo), dalam koordinat painter
+STATS_RECT = QRectF(0, 0, 480, 175)
+TOP_BAND_HEIGHT = 90
+
+# Transform yang masih bisa memakai pixmap teks dari cache (tanpa rotasi/shear)
+_PLAIN_TRANSFORMS = (QTransform.TxNone, QTransform.TxTranslate, QTransform.TxScale)
+
+# Warna indikator level per tema (hue berulang tiap 8 level)
+LEVEL_COLORS = tuple(
+    QColor.fromHsv(hue, 180, 255) for hue in (220, 270, 350, 160, 40, 180, 310, 190)
+)
+
+
+@functools.lru_cache(maxsize=256)
+def _render_text_pixmap(text, family, size, weight, rgba, scale, dpr):
+    """Text + shadow painted once on a transparent pixmap -> (pixmap, origin x, origin y)
+
+    The pixmap is in device pixels for the painter's transform scale and the
+    device DPR, with the text origin on a whole pixel, so it is blitted 1:1
+    and never resampled.
+    """
+    text_font = font(family, size, weight)
+    bounds = QFontMetrics(text_font).boundingRect(text)
+    device_scale = scale * dpr
+    origin_x = math.ceil((TEXT_MARGIN - bounds.left()) * device_scale)
+    origin_y = math.ceil((TEXT_MARGIN - bounds.top()) * device_scale)
+    width = origin_x + math.ceil((bounds.right() + TEXT_MARGIN + SHADOW_OFFSET) * device_scale) + 1
+    height = origin_y + math.ceil((bounds.bottom() + TEXT_MARGIN + SHADOW_OFFSET) * device_scale) + 1
+    
+    # Same DPR as the target device so glyphs are hinted the same way
+    pixmap = QPixmap(width, height)
+    pixmap.setDevicePixelRatio(dpr)
+    pixmap.fill(Qt.transparent)
+    
+    painter = QPainter(pixmap)
+    painter.setRenderHint(QPainter.Antialiasing)
+    painter.translate(origin_x / dpr, origin_y / dpr)
+    painter.scale(scale, scale)
+    painter.setFont(text_font)
+    painter.setPen(QColor(0, 0, 0, 150))
+    painter.drawText(SHADOW_OFFSET, SHADOW_OFFSET, text)
+    painter.setPen(QColor.fromRgba(rgba))
+    painter.drawText(0, 0, text)
+    painter.end()
+    
+    return pixmap, origin_x, origin_y
+
+
+@functools.lru_cache(maxsize=64)
+def _static_text(text, family, size, weight):
+    """Laid-out QStaticText for text drawn under a changing transform -> (text, ascent)"""
+    text_font = font(family, size, weight)
+    static_text = QStaticText(text)
+    static_text.setPerformanceHint(QStaticText.AggressiveCaching)
+    static_text.prepare(QTransform(), text_font)
+    return static_text, QFontMetrics(text_font).ascent()
 
 class HUD:
     """Heads-up display overlay"""
@@ -15,44 +84,167 @@ class HUD:
         self.combo = 0
         self.level = 1
         # --- TAMBAHKAN INI ---
-        self.bonus_msg_timer = 0
+        self._bonus_expires = 0.0  # time.monotonic() saat pesan bonus hilang
         self.bonus_msg = ""
+        
+        # Teks status di-format ulang hanya saat nilainya berubah
+        self._score_text = "SCORE: 0"
+        self._best_text = "BEST: 0"
+        self._combo_text = ""
+        self._level_cached = None
+        self._level_text = ""
+        self._lives_cached = None
+        self._lives_text = ""
+        self._progress_cached = None
+        self._progress_text = ""
+        self._info_chain = None
+        self._chain_has_info = False
+        
+        # Fonts, colors and pens are built once, draw() only reuses them
+        self._font_level = font("Arial", 24, QFont.Bold)
+        self._font_score = font("Arial", 18, QFont.Bold)
+        self._font_best = font("Arial", 14, QFont.Bold)
+        self._font_lives = font("Arial", 16, QFont.Bold)
+        self._font_progress = font("Arial", 13, QFont.Bold)
+        self._font_slowmo = font("Arial", 16, QFont.Bold)
+        self._font_combo = font("Arial", 24, QFont.Bold)
+        self._font_bonus = font("Arial", 28, QFont.Bold)
+        # Metrics untuk mengukur teks tanpa setFont di painter
+        self._metrics_combo = QFontMetrics(self._font_combo)
+        self._metrics_bonus = QFontMetrics(self._font_bonus)
+        
+        self._color_gold = QColor(255, 215, 0)
+        self._color_purple = QColor(200, 100, 255)
+        self._color_life_low = QColor(255, 100, 100)
+        self._color_life_ok = QColor(100, 255, 100)
+        self._color_progress = QColor(100, 200, 255)
+        self._color_progress_done = QColor(255, 200, 100)
+        self._color_slowmo = QColor(255, 255, 100)
+        self._color_combo = QColor(255, 100, 100)
+        self._pen_shadow = QPen(QColor(0, 0, 0, 150), 2)
+        self._text_cached = True  # diisi ulang oleh _set_text_space() tiap frame
+        self._text_scale = 1.0
+        self._text_dx = self._text_dy = 0.0
+        self._text_dpr = 1.0
+        self._text_unscaled = True
 
     def show_bonus_message(self, message):
         """Memicu pesan bonus untuk muncul di layar"""
         self.bonus_msg = message
-        self.bonus_msg_timer = 3.0  # Tampilkan selama 3 detik
+        self._bonus_expires = time.monotonic() + 3.0  # Tampilkan selama 3 detik
         
     def update_score(self, score):
         """Update score display"""
         self.score = score
+        self._score_text = f"SCORE: {score}"
         
     def update_high_score(self, high_score):
         """Update high score display"""
         self.high_score = high_score
+        self._best_text = f"BEST: {high_score}"
         
     def update_combo(self, combo):
         """Update combo display"""
         self.combo = combo
+        self._combo_text = f"COMBO x{combo}!"
         
     def update_level(self, level):
         """Update level display"""
         self.level = level
         
-    def draw(self, painter):
-        """Draw HUD elements"""
+    def draw(self, painter, event_rect=None):
+        """Draw HUD elements; sections outside event_rect (painter coords) are skipped"""
         painter.setRenderHint(QPainter.Antialiasing)
+        self._set_text_space(painter)
+        
+        if event_rect is None or event_rect.intersects(STATS_RECT):
+            self._draw_stats(painter)
         
+        # Slow motion indicator
+        scene_width = self.scene.width()
+        if getattr(self.scene, 'slow_motion_active', False) and (
+            event_rect is None
+            or event_rect.intersects(QRectF(scene_width - 230, 0, 230, TOP_BAND_HEIGHT))
+        ):
+            slow_mo_percent = int(self.scene.slow_motion_factor * 100)
+            self._draw_text(
+                painter,
+                f"⏱ SLOW-MO: {slow_mo_percent}%",
+                scene_width - 220, 30,
+                self._font_slowmo,
+                self._color_slowmo
+            )
+        
+        # Combo (Sama seperti sebelumnya)
+        if self.combo > 1 and (
+            event_rect is None or event_rect.intersects(QRectF(0, 0, scene_width, TOP_BAND_HEIGHT))
+        ):
+            combo_text = self._combo_text
+            
+            pulse = math.sin(self.scene.animation_time * 5) * 0.1 + 1
+            
+            text_width = self._metrics_combo.horizontalAdvance(combo_text)
+            x = scene_width // 2 - text_width // 2
+            y = 50
+            
+            if abs(pulse - 1) < 0.01:
+                # Praktis tidak di-scale: pakai teks dari cache
+                self._draw_text(painter, combo_text, x, y, self._font_combo, self._color_combo)
+            else:
+                # Scale around (center_x, y) with one transform
+                center_x = x + text_width // 2
+                transform = painter.transform()
+                painter.setTransform(
+                    QTransform(pulse, 0, 0, pulse, center_x * (1 - pulse), y * (1 - pulse)),
+                    True
+                )
+                self._draw_text_direct(
+                    painter,
+                    combo_text,
+                    x, y,
+                    self._font_combo,
+                    self._color_combo
+                )
+                painter.setTransform(transform)
+
+        # Bonus
+        remaining = self._bonus_expires - time.monotonic()
+        bonus_y = self.scene.height() // 3
+        if remaining > 0 and (
+            event_rect is None
+            or event_rect.intersects(QRectF(0, bonus_y - 60, scene_width, 80))
+        ):
+            # Hitung opacity berdasarkan sisa waktu (fade out)
+            opacity = min(255, int(remaining * 255))
+            
+            painter.setFont(self._font_bonus)
+            painter.setPen(QColor(255, 215, 0, opacity)) # Warna Emas
+            
+            # Gambar di tengah layar agak ke atas
+            text_rect = self._metrics_bonus.boundingRect(self.bonus_msg)
+            x = (scene_width - text_rect.width()) // 2
+            y = bonus_y
+            
+            font = self._font_bonus
+            static_text, ascent = _static_text(
+                self.bonus_msg, font.family(), font.pointSize(), font.weight()
+            )
+            painter.drawStaticText(x, y - ascent, static_text)
+            
+    def _draw_stats(self, painter):
+        """Level, score, best, lives and orb progress in the top-left corner"""
         # Level indicator
-        level_themes = [220, 270, 350, 160, 40, 180, 310, 190]
-        theme_hue = level_themes[(self.scene.level - 1) % len(level_themes)]
-        level_color = QColor.fromHsv(theme_hue, 180, 255)
+        level_color = LEVEL_COLORS[(self.scene.level - 1) % len(LEVEL_COLORS)]
+        
+        if self.scene.level != self._level_cached:
+            self._level_cached = self.scene.level
+            self._level_text = f"LEVEL {self.scene.level}"
         
         self._draw_text(
             painter,
-            f"LEVEL {self.scene.level}",
+            self._level_text,
             20, 30,
-            QFont("Arial", 24, QFont.Bold),
+            self._font_level,
             level_color
         )
         
@@ -61,130 +253,123 @@ class HUD:
         # Current Score
         self._draw_text(
             painter,
-            f"SCORE: {self.score}",
+            self._score_text,
             20, 65,
-            QFont("Arial", 18, QFont.Bold),
-            QColor(255, 215, 0) # Gold
+            self._font_score,
+            self._color_gold
         )
         
         # Best Score (Ditampilkan di tengah atas atau di bawah score)
         # Kita taruh di bawah score dengan warna ungu/spesial
         self._draw_text(
             painter,
-            f"BEST: {self.high_score}",
+            self._best_text,
             20, 90, 
-            QFont("Arial", 14, QFont.Bold),
-            QColor(200, 100, 255) # Light Purple
+            self._font_best,
+            self._color_purple
         )
         
         # Lives (Koordinat Y disesuaikan karena ada Best Score)
         lives = self.scene.parent_window.game_manager.lives
-        life_color = QColor(255, 100, 100) if lives <= 2 else QColor(100, 255, 100)
+        life_color = self._color_life_low if lives <= 2 else self._color_life_ok
+        if lives != self._lives_cached:
+            self._lives_cached = lives
+            self._lives_text = f"LIVES: {lives}"
         self._draw_text(
             painter,
-            f"LIVES: {lives}",
+            self._lives_text,
             20, 120, # Turun sedikit
-            QFont("Arial", 16, QFont.Bold),
+            self._font_lives,
             life_color
         )
         
         # Orbs remaining counter
-        if self.scene.chain:
-            try:
-                orb_info = self.scene.chain.get_total_orbs_info()
-                remaining = orb_info['remaining']
-                current = orb_info['current']
-                spawned = orb_info['spawned']
-                max_orbs = orb_info['max']
-                
-                # Show progress
+        chain = self.scene.chain
+        if chain is not self._info_chain:
+            # Cek sekali per chain baru, bukan try/except tiap frame
+            self._info_chain = chain
+            self._chain_has_info = hasattr(chain, 'get_total_orbs_info')
+        if chain and self._chain_has_info:
+            orb_info = chain.get_total_orbs_info()
+            remaining = orb_info['remaining']
+            spawned = orb_info['spawned']
+            max_orbs = orb_info['max']
+            
+            # Show progress
+            progress_key = (spawned, max_orbs, remaining)
+            if progress_key != self._progress_cached:
+                self._progress_cached = progress_key
                 progress_text = f"Progress: {spawned}/{max_orbs}"
                 if remaining > 0:
                     progress_text += f" ({remaining} left)" # Shortened text
                 else:
                     progress_text += f" (Clear all!)"
-                
-                progress_color = QColor(100, 200, 255) if remaining > 0 else QColor(255, 200, 100)
-                
-                self._draw_text(
-                    painter,
-                    progress_text,
-                    20, 150, # Turun sedikit
-                    QFont("Arial", 13, QFont.Bold),
-                    progress_color
-                )
-            except AttributeError:
-                pass
-        
-        # Slow motion indicator
-        if hasattr(self.scene, 'slow_motion_active') and self.scene.slow_motion_active:
-            slow_mo_percent = int(self.scene.slow_motion_factor * 100)
-            self._draw_text(
-                painter,
-                f"⏱ SLOW-MO: {slow_mo_percent}%",
-                self.scene.width() - 220, 30,
-                QFont("Arial", 16, QFont.Bold),
-                QColor(255, 255, 100)
-            )
-        
-        # Combo (Sama seperti sebelumnya)
-        if self.combo > 1:
-            combo_text = f"COMBO x{self.combo}!"
-            font = QFont("Arial", 24, QFont.Bold)
+                self._progress_text = progress_text
             
-            import math
-            pulse = math.sin(self.scene.animation_time * 5) * 0.1 + 1
-            painter.save()
-            
-            text_width = painter.fontMetrics().horizontalAdvance(combo_text)
-            x = self.scene.width() // 2 - text_width // 2
-            y = 50
-            
-            painter.translate(x + text_width // 2, y)
-            painter.scale(pulse, pulse)
-            painter.translate(-(x + text_width // 2), -y)
+            progress_color = self._color_progress if remaining > 0 else self._color_progress_done
             
             self._draw_text(
                 painter,
-                combo_text,
-                x, y,
-                font,
-                QColor(255, 100, 100)
+                self._progress_text,
+                20, 150, # Turun sedikit
+                self._font_progress,
+                progress_color
             )
-            
-            painter.restore()
 
-        # Bonus
-        if self.bonus_msg_timer > 0:
-            # Hitung opacity berdasarkan sisa waktu (fade out)
-            opacity = min(255, int(self.bonus_msg_timer * 255))
-            
-            painter.save()
-            font = QFont("Arial", 28, QFont.Bold)
-            painter.setFont(font)
-            painter.setPen(QColor(255, 215, 0, opacity)) # Warna Emas
-            
-            # Gambar di tengah layar agak ke atas
-            text_rect = painter.fontMetrics().boundingRect(self.bonus_msg)
-            x = (self.scene.width() - text_rect.width()) // 2
-            y = self.scene.height() // 3
-            
-            painter.drawText(x, y, self.bonus_msg)
-            painter.restore()
-            
-            # Kurangi timer (dt biasanya 1/60 atau dari update scene)
-            # Karena HUD tidak punya method update mandiri yang dipanggil dt, 
-            # kita kurangi sedikit setiap frame draw
-            self.bonus_msg_timer -= 0.016
-            
+    def _set_text_space(self, painter):
+        """Read the painter transform/DPR once per frame for _draw_text"""
+        transform = painter.transform()
+        scale = transform.m11()
+        self._text_cached = (
+            transform.type() in _PLAIN_TRANSFORMS and scale > 0 and scale == transform.m22()
+        )
+        self._text_scale = scale
+        self._text_dx = transform.dx()
+        self._text_dy = transform.dy()
+        self._text_dpr = painter.device().devicePixelRatioF()
+        # Pixel-aligned translation only: the pixmap can be drawn as is
+        self._text_unscaled = (
+            scale == 1 and self._text_dpr == 1
+            and self._text_dx.is_integer() and self._text_dy.is_integer()
+        )
+    
     def _draw_text(self, painter, text, x, y, font, color):
-        """Draw text with shadow"""
+        """Draw text with shadow from the rendered text cache (1:1 on device pixels)"""
+        if not self._text_cached:
+            # Rotated/sheared, mirrored or non-uniform: no 1:1 pixmap for that
+            self._draw_text_direct(painter, text, x, y, font, color)
+            return
+        scale = self._text_scale
+        dpr = self._text_dpr
+        font_key = (font.family(), font.pointSize(), font.weight())
+        
+        # Text origin snapped to the nearest device pixel, so one pixmap per
+        # label serves every painter offset (screen shake moves it each frame)
+        pixel_x = math.floor((x * scale + self._text_dx) * dpr + 0.5)
+        pixel_y = math.floor((y * scale + self._text_dy) * dpr + 0.5)
+        pixmap, origin_x, origin_y = _render_text_pixmap(
+            text, *font_key, color.rgba(), scale, dpr
+        )
+        left = pixel_x - origin_x
+        top = pixel_y - origin_y
+        
+        if self._text_unscaled:
+            painter.drawPixmap(left - int(self._text_dx), top - int(self._text_dy), pixmap)
+        else:
+            painter.setWorldMatrixEnabled(False)
+            painter.drawPixmap(QPointF(left / dpr, top / dpr), pixmap)
+            painter.setWorldMatrixEnabled(True)
+    
+    def _draw_text_direct(self, painter, text, x, y, font, color):
+        """Draw text with shadow straight through the painter (for scaled text)"""
+        static_text, ascent = _static_text(text, font.family(), font.pointSize(), font.weight())
+        top = y - ascent
         painter.setFont(font)
         
         # Shadow
-        painter.setPen(QPen(QColor(0, 0, 0, 150), 2))
-        painter.drawText(x + 2, y + 2, text)
+        painter.setPen(self._pen_shadow)
+        painter.drawStaticText(x + 2, top + 2, static_text)
         
         # Main text
-        painter.setPen(QPen(color, 1))
-        painter.drawText(x, y, text)
+        painter.setPen(color)
+        painter.drawStaticText(x, top, static_text)
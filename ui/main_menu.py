@@ -3,22 +3,68 @@ Main menu interface with wallpaper support
 UPDATED: Added Achievement, Trailer, Story, and About buttons
 """
 
-from PySide6.QtWidgets import QWidget, QVBoxLayout, QPushButton, QLabel
-from PySide6.QtCore import Qt, QTimer, QRectF
-from PySide6.QtGui import QPainter, QColor, QLinearGradient, QFont, QRadialGradient, QPixmap
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel
+from PySide6.QtCore import (Qt, QTimer, QRect, QRectF, QSize, QElapsedTimer, QRunnable, QThreadPool,
+                            Signal)
+from PySide6.QtGui import (QPainter, QColor, QLinearGradient, QFont, QRadialGradient, QPixmap,
+                           QRegion, QTransform, QBrush, QImage, QImageReader)
 from PySide6.QtMultimedia import QMediaPlayer
 from app.state_manager import GameState
 from ui.video_player import VideoPlayer
 from ui.story_viewer import StoryViewer
 from ui.achievement_viewer import AchievementViewer
+from ui.gradient_button import GradientButton
 import math
 import os
 
+# Decorative orbs: per-orb phase as (sin, cos) pairs, so each frame needs
+# only the sin/cos of the shared angles (sin(a + p) = sin a cos p + cos a sin p)
+MENU_ORB_COUNT = 15
+_ORB_PHASES = tuple(
+    (
+        (math.sin(i * 0.5), math.cos(i * 0.5)),  # x
+        (math.sin(i * 0.7), math.cos(i * 0.7)),  # y
+        (math.sin(i), math.cos(i))               # size
+    )
+    for i in range(MENU_ORB_COUNT)
+)
+_ORB_RGB = ((255, 0, 0), (0, 0, 255), (0, 255, 0), (255, 255, 0), (255, 0, 255))
+# Background animation speed (radians per second, same as 0.01 per 16 ms tick)
+MENU_ANIMATION_SPEED = 0.625
+
+# Orb ellipse in unit space; the gradient spans twice its radius
+_ORB_UNIT_RECT = QRectF(-0.5, -0.5, 1, 1)
+
+class _WallpaperJob(QRunnable):
+    """Decodes the menu wallpaper on a QThreadPool worker"""
+    
+    def __init__(self, image_path, menu):
+        super().__init__()
+        self.image_path = image_path
+        self.menu = menu
+    
+    def run(self):
+        # QImage (unlike QPixmap) is safe to use off the GUI thread
+        image = QImageReader(self.image_path).read()
+        try:
+            self.menu.wallpaper_loaded.emit(image)
+        except RuntimeError:
+            pass  # Menu was deleted before the decode finished
+
+
 class MainMenu(QWidget):
+    wallpaper_loaded = Signal(QImage)
+    
     def __init__(self, parent):
         super().__init__()
         self.parent_window = parent
         self.animation_offset = 0
+        self._elapsed = QElapsedTimer()
+        self._elapsed.start()
+        self._orb_rects = []  # orb areas of the last frame (for the dirty region)
+        self._last_frame_key = None  # rounded orb positions/colours of the last frame
+        self._orb_geometry_key = None  # (offset, width, height) of the stored geometry
+        self._orb_geometry_cache = []
         
         # Idle time tracker for achievement
         self.idle_time = 0
@@ -27,12 +73,26 @@ class MainMenu(QWidget):
         self.idle_timer.start(1000)  # Track every second
         
         # Load Wallpaper Image
-        self.bg_image = None        
+        self.bg_image = None
+        self._scaled_bg = None  # wallpaper scaled + darkened for the current size
+        self._scaled_bg_size = None
+        self._scaled_bg_smooth = False
+        
+        # During a live resize use FastTransformation, then rescale smoothly
+        # once the size stops changing
+        self._smooth_bg_timer = QTimer(self)
+        self._smooth_bg_timer.setSingleShot(True)
+        self._smooth_bg_timer.setInterval(200)
+        self._smooth_bg_timer.timeout.connect(self._refresh_smooth_bg)
+        self._orb_brushes = []
+        self._build_orb_brushes()
+        
+        # Decode on the thread pool; until it finishes the menu uses the gradient fallback
         image_path = "./ancient_gfx/splash.webp" 
         
         if os.path.exists(image_path):
-            self.bg_image = QPixmap(image_path)
-            print(f"MainMenu: Wallpaper loaded from {image_path}")
+            self.wallpaper_loaded.connect(self._on_wallpaper_loaded)
+            QThreadPool.globalInstance().start(_WallpaperJob(image_path, self))
         else:
             print(f"MainMenu: Wallpaper not found at {image_path}, using gradient.")
 
@@ -58,80 +118,38 @@ class MainMenu(QWidget):
         
         layout.addSpacing(50)
         
-        # Buttons Style
-        button_style = """
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                                           stop:0 #8B4513, stop:1 #654321);
-                color: #FFD700;
-                border: 2px solid #FFD700;
-                border-radius: 10px;
-                padding: 15px 40px;
-                font-size: 18px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                                           stop:0 #A0522D, stop:1 #8B4513);
-                border: 2px solid #FFA500;
-            }
-            QPushButton:pressed {
-                background: #654321;
-            }
-        """
-        
         # Create Buttons
-        self.create_button("New Game", self.new_game, layout, button_style)
-        self.create_button("Load Game", self.load_game, layout, button_style)
-        self.create_button("Settings", self.show_settings, layout, button_style)
-        self.create_button("Quit", self.quit_game, layout, button_style)
+        self.create_button("New Game", self.new_game, layout)
+        self.create_button("Load Game", self.load_game, layout)
+        self.create_button("Settings", self.show_settings, layout)
+        self.create_button("Quit", self.quit_game, layout)
         
         # Corner buttons (Trailer, Story, Achievement, About)
-        corner_button_style = """
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                                           stop:0 #8B4513, stop:1 #654321);
-                color: #FFD700;
-                border: 2px solid #FFD700;
-                border-radius: 8px;
-                padding: 10px 20px;
-                font-size: 14px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                                           stop:0 #A0522D, stop:1 #8B4513);
-                border: 2px solid #FFA500;
-            }
-        """
+        corner_button_style = dict(radius=8, padding=(20, 10), font_size=14, pressed_state=False)
         
         # Achievement button (left side, above Trailer)
-        self.achievement_button = QPushButton("🏆 Achievement", self)
-        self.achievement_button.setStyleSheet(corner_button_style)
+        self.achievement_button = GradientButton("🏆 Achievement", self, **corner_button_style)
         self.achievement_button.clicked.connect(self.show_achievements)
         self.achievement_button.setCursor(Qt.PointingHandCursor)
         self.achievement_button.setFixedSize(160, 50)
         self.achievement_button.raise_()
         
         # Trailer button (bottom-left)
-        self.trailer_button = QPushButton("🎬 Trailer", self)
-        self.trailer_button.setStyleSheet(corner_button_style)
+        self.trailer_button = GradientButton("🎬 Trailer", self, **corner_button_style)
         self.trailer_button.clicked.connect(self.show_trailer)
         self.trailer_button.setCursor(Qt.PointingHandCursor)
         self.trailer_button.setFixedSize(140, 50)
         self.trailer_button.raise_()
         
         # About button (right side, above Story)
-        self.about_button = QPushButton("ℹ️ About", self)
-        self.about_button.setStyleSheet(corner_button_style)
+        self.about_button = GradientButton("ℹ️ About", self, **corner_button_style)
         self.about_button.clicked.connect(self.show_about)
         self.about_button.setCursor(Qt.PointingHandCursor)
         self.about_button.setFixedSize(140, 50)
         self.about_button.raise_()
         
         # Story button (bottom-right)
-        self.story_button = QPushButton("📖 Story", self)
-        self.story_button.setStyleSheet(corner_button_style)
+        self.story_button = GradientButton("📖 Story", self, **corner_button_style)
         self.story_button.clicked.connect(self.show_story)
         self.story_button.setCursor(Qt.PointingHandCursor)
         self.story_button.setFixedSize(140, 50)
@@ -141,23 +159,143 @@ class MainMenu(QWidget):
         
         # Animation timer
         self.timer = QTimer()
+        self.timer.setTimerType(Qt.PreciseTimer)
         self.timer.timeout.connect(self.animate)
         self.timer.start(16)  # ~60 FPS
         
         # Initial button positioning
         QTimer.singleShot(100, self.position_corner_buttons)
 
-    def create_button(self, text, slot, layout, style):
-        btn = QPushButton(text)
-        btn.setStyleSheet(style)
+    def _build_orb_brushes(self):
+        """Orb brushes, built once at unit size and scaled per orb when drawn"""
+        alpha = 40 if self.bg_image else 60
+        self._orb_brushes = []
+        for r, g, b in _ORB_RGB:
+            radial = QRadialGradient(0, 0, 1)
+            radial.setColorAt(0, QColor(r, g, b, alpha))
+            radial.setColorAt(1, QColor(r, g, b, 0))
+            self._orb_brushes.append(QBrush(radial))
+    
+    def _on_wallpaper_loaded(self, image):
+        """Wallpaper decoded in the background: switch from the gradient"""
+        if image.isNull():
+            print("MainMenu: Failed to decode wallpaper, using gradient.")
+            return
+        self.bg_image = QPixmap.fromImage(image)
+        print(f"MainMenu: Wallpaper loaded ({image.width()}x{image.height()})")
+        self._scaled_bg = None
+        self._build_orb_brushes()
+        self._last_frame_key = None
+        self.update()
+    
+    def create_button(self, text, slot, layout):
+        btn = GradientButton(text)
         btn.clicked.connect(slot)
         btn.setGraphicsEffect(None) 
         layout.addWidget(btn, alignment=Qt.AlignCenter)
         
     def animate(self):
         """Animate background elements"""
-        self.animation_offset += 0.01
-        self.update()
+        # Follow the wall clock, not the tick count, so slow frames don't slow the animation
+        self.animation_offset = self._elapsed.nsecsElapsed() * 1e-9 * MENU_ANIMATION_SPEED
+        
+        # Skip the repaint while nothing moved a whole pixel (or changed hue)
+        geometry = self._orb_geometry()
+        frame_key = tuple((int(x), int(y), int(size)) for x, y, size in geometry)
+        if not self.bg_image:
+            frame_key += self._gradient_hues()
+        if frame_key == self._last_frame_key:
+            return
+        self._last_frame_key = frame_key
+        
+        # Gradient fallback changes everywhere, so repaint the whole menu
+        if not self.bg_image:
+            self.update()
+            return
+        
+        # Over the wallpaper only the orbs move: repaint old + new orb areas
+        # (integer bounds + 1px margin, no temporary QRectF per orb)
+        new_rects = []
+        for x, y, size in geometry:
+            half = size / 2
+            left = math.floor(x - half) - 1
+            top = math.floor(y - half) - 1
+            new_rects.append(QRect(
+                left, top,
+                math.ceil(x + half) + 1 - left, math.ceil(y + half) + 1 - top
+            ))
+        dirty = QRegion()
+        for rect in self._orb_rects:
+            dirty += rect
+        for rect in new_rects:
+            dirty += rect
+        self._orb_rects = new_rects
+        self.update(dirty)
+    
+    def _get_scaled_bg(self):
+        """Wallpaper scaled to the menu (at device pixels) with the dark overlay baked in"""
+        dpr = self.devicePixelRatioF()
+        if (self._scaled_bg is None or self._scaled_bg_size != self.size()
+                or self._scaled_bg.devicePixelRatio() != dpr):
+            smooth = not self._smooth_bg_timer.isActive()
+            device_size = self.size() * dpr
+            scaled_pixmap = self.bg_image.scaled(
+                device_size, 
+                Qt.KeepAspectRatioByExpanding, 
+                Qt.SmoothTransformation if smooth else Qt.FastTransformation
+            )
+            
+            x = (device_size.width() - scaled_pixmap.width()) // 2
+            y = (device_size.height() - scaled_pixmap.height()) // 2
+            
+            background = QPixmap(device_size)
+            painter = QPainter(background)
+            painter.drawPixmap(x, y, scaled_pixmap)
+            painter.fillRect(background.rect(), QColor(0, 0, 0, 100))
+            painter.end()
+            background.setDevicePixelRatio(dpr)
+            
+            self._scaled_bg = background
+            self._scaled_bg_size = QSize(self.size())
+            self._scaled_bg_smooth = smooth
+        return self._scaled_bg
+    
+    def _refresh_smooth_bg(self):
+        """Resize finished: rescale the wallpaper with smooth filtering"""
+        if self._scaled_bg is not None and not self._scaled_bg_smooth:
+            self._scaled_bg = None
+            self.update()
+    
+    def _orb_geometry(self):
+        """Orb geometry for the current frame, computed once per offset/size"""
+        key = (self.animation_offset, self.width(), self.height())
+        if key != self._orb_geometry_key:
+            self._orb_geometry_key = key
+            self._orb_geometry_cache = self._compute_orb_geometry()
+        return self._orb_geometry_cache
+    
+    def _compute_orb_geometry(self):
+        """Center and size of every decorative orb for the current frame"""
+        width = self.width()
+        height = self.height()
+        offset = self.animation_offset
+        sin_x, cos_x = math.sin(offset), math.cos(offset)
+        sin_y, cos_y = math.sin(offset * 0.8), math.cos(offset * 0.8)
+        sin_s, cos_s = math.sin(offset * 2), math.cos(offset * 2)
+        return [
+            (
+                ((sin_x * pcx + cos_x * psx) * 0.3 + 0.5) * width,     # sin(offset + i*0.5)
+                ((cos_y * pcy - sin_y * psy) * 0.3 + 0.5) * height,    # cos(offset*0.8 + i*0.7)
+                20 + (sin_s * pcs + cos_s * pss) * 10                  # sin(offset*2 + i)
+            )
+            for (psx, pcx), (psy, pcy), (pss, pcs) in _ORB_PHASES
+        ]
+        
+    def _gradient_hues(self):
+        """Hue pair of the fallback gradient for the current animation offset"""
+        hue1 = (math.sin(self.animation_offset) * 0.1 + 0.05) * 360
+        hue2 = (math.cos(self.animation_offset * 0.7) * 0.1 + 0.15) * 360
+        return int(hue1) % 360, int(hue2) % 360
         
     def paintEvent(self, event):
         """Draw background"""
@@ -166,49 +304,36 @@ class MainMenu(QWidget):
         
         # 1. Draw Background Image or Fallback Gradient
         if self.bg_image:
-            scaled_pixmap = self.bg_image.scaled(
-                self.size(), 
-                Qt.KeepAspectRatioByExpanding, 
-                Qt.SmoothTransformation
-            )
-            
-            x = (self.width() - scaled_pixmap.width()) // 2
-            y = (self.height() - scaled_pixmap.height()) // 2
-            painter.drawPixmap(x, y, scaled_pixmap)
-            
-            painter.fillRect(self.rect(), QColor(0, 0, 0, 100))
+            # Only the exposed part (orb areas during animation)
+            exposed = event.rect()
+            background = self._get_scaled_bg()
+            dpr = background.devicePixelRatio()
+            source = QRectF(exposed.x() * dpr, exposed.y() * dpr,
+                            exposed.width() * dpr, exposed.height() * dpr)
+            painter.drawPixmap(QRectF(exposed), background, source)
             
         else:
             gradient = QLinearGradient(0, 0, self.width(), self.height())
-            hue1 = (math.sin(self.animation_offset) * 0.1 + 0.05) * 360
-            hue2 = (math.cos(self.animation_offset * 0.7) * 0.1 + 0.15) * 360
-            color1 = QColor.fromHsv(int(hue1) % 360, 60, 40)
-            color2 = QColor.fromHsv(int(hue2) % 360, 80, 20)
+            hue1, hue2 = self._gradient_hues()
+            color1 = QColor.fromHsv(hue1, 60, 40)
+            color2 = QColor.fromHsv(hue2, 80, 20)
             gradient.setColorAt(0, color1)
             gradient.setColorAt(1, color2)
             painter.fillRect(self.rect(), gradient)
         
         # 2. Draw animated decorative orbs
-        for i in range(15):
-            x = (math.sin(self.animation_offset + i * 0.5) * 0.3 + 0.5) * self.width()
-            y = (math.cos(self.animation_offset * 0.8 + i * 0.7) * 0.3 + 0.5) * self.height()
-            size = 20 + math.sin(self.animation_offset * 2 + i) * 10
-            
-            radial = QRadialGradient(x, y, size)
-            colors = [QColor(255, 0, 0), QColor(0, 0, 255), QColor(0, 255, 0), 
-                     QColor(255, 255, 0), QColor(255, 0, 255)]
-            color = colors[i % len(colors)]
-            
-            alpha = 40 if self.bg_image else 60
-            color.setAlpha(alpha)
-            
-            radial.setColorAt(0, color)
-            color.setAlpha(0)
-            radial.setColorAt(1, color)
-            
-            painter.setBrush(radial)
-            painter.setPen(Qt.NoPen)
-            painter.drawEllipse(QRectF(x - size/2, y - size/2, size, size))
+        # Orbs are soft gradients at low alpha, edge antialiasing is not visible
+        painter.setRenderHint(QPainter.Antialiasing, False)
+        brushes = self._orb_brushes
+        geometry = self._orb_geometry()
+        painter.setPen(Qt.NoPen)
+        # One setBrush per colour (orb i uses colour i % 5)
+        for color_index, brush in enumerate(brushes):
+            painter.setBrush(brush)
+            for x, y, size in geometry[color_index::len(brushes)]:
+                painter.setTransform(QTransform(size, 0, 0, size, x, y))
+                painter.drawEllipse(_ORB_UNIT_RECT)
+        painter.resetTransform()
         
     def new_game(self):
         """Start new game with intro videos"""
@@ -365,6 +490,10 @@ class MainMenu(QWidget):
     def resizeEvent(self, event):
         """Position corner buttons on resize"""
         super().resizeEvent(event)
+        if self._scaled_bg is not None:
+            # Already shown once: this is a live resize, rescale fast for now
+            self._smooth_bg_timer.start()
+        self._scaled_bg = None
         self.position_corner_buttons()
     
     def showEvent(self, event):
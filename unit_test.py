@@ -4,11 +4,13 @@ import shutil
 import json
 import os
 from pathlib import Path
+from datetime import datetime
 from unittest.mock import MagicMock, patch
 from services.save_manager import SaveManager
 from services.settings_manager import SettingsManager
 from services.cheat_system import CheatSystem
 from services.achievement_system import AchievementManager
+from services.achievement_tracker import AchievementTracker
 
 # --- MOCK OBJECTS (Objek Palsu untuk Test) ---
 class MockGameManager:
@@ -108,6 +110,17 @@ class TestAncientTiger(unittest.TestCase):
             # Assert: Setting harus tersimpan
             self.assertFalse(new_settings_session.get('music_enabled'))
             self.assertEqual(new_settings_session.get('music_volume'), 0.5)
+            
+            # set() + flush() tanpa save_settings() juga harus tersimpan
+            new_settings_session.set('sfx_volume', 0.3)
+            new_settings_session.flush()
+            self.assertEqual(SettingsManager().get('sfx_volume'), 0.3)
+            
+            # High score disimpan terpisah di state.json
+            new_settings_session.set('high_score', 4200)
+            new_settings_session.flush()
+            self.assertTrue((self.test_path / "state.json").exists())
+            self.assertEqual(SettingsManager().get('high_score'), 4200)
 
     # ----------------------------------------------------------------
     # 3. TEST CHEAT SYSTEM (LOGIC)
@@ -144,6 +157,10 @@ class TestAncientTiger(unittest.TestCase):
         # Test 4: Cheat Ngawur (Harus gagal)
         success, msg = cheat_sys.execute_cheat("DUITBANYAK")
         self.assertFalse(success)
+        
+        # Test 5: Parameter dipisah whitespace apa saja, token ekstra diabaikan
+        self.assertEqual(cheat_sys.execute_cheat("GOTOLEVEL\t10"), (True, "GOTO_LEVEL:10"))
+        self.assertEqual(cheat_sys.execute_cheat("GOTOLEVEL 10 x"), (True, "GOTO_LEVEL:10"))
 
     # ----------------------------------------------------------------
     # 4. TEST ACHIEVEMENT SYSTEM
@@ -164,12 +181,55 @@ class TestAncientTiger(unittest.TestCase):
             self.assertTrue(unlocked, "Harusnya return True saat unlock baru")
             self.assertTrue(ach_manager.is_unlocked("first_launch"))
             
-            # Cek apakah file json kebuat
-            self.assertTrue((self.test_path / "achievements.json").exists())
+            # Cek apakah file store binary kebuat
+            self.assertTrue((self.test_path / "achievements.bin").exists())
+            
+            # Simulate restart: unlock + stats harus kebaca lagi dari file
+            ach_manager.stats['orbs_destroyed'] = 42
+            ach_manager.save_achievements()
+            reloaded = AchievementManager()
+            self.assertTrue(reloaded.is_unlocked("first_launch"))
+            self.assertEqual(reloaded.stats['orbs_destroyed'], 42)
+            
+            # Stat yang sudah lewat threshold di file tetap unlock di event pertama
+            ach_manager.stats['max_combo'] = 10
+            ach_manager.save_achievements()
+            tracker = AchievementTracker(AchievementManager())
+            tracker.on_orb_destroyed()
+            self.assertTrue(tracker.manager.is_unlocked("combo_master"))
             
             # Test unlock duplikat (harusnya return False)
             unlocked_again = ach_manager.unlock("first_launch")
             self.assertFalse(unlocked_again, "Harusnya return False kalau sudah pernah unlock")
+            
+            # Grouping harus sama dengan get_categories + get_by_category
+            for category, achievements in ach_manager.get_grouped():
+                self.assertIs(achievements, ach_manager.get_by_category(category))
+            self.assertEqual([c for c, _ in ach_manager.get_grouped()], list(ach_manager.get_categories()))
+        
+        # Migrasi achievements.json lama (entry tanpa 'timestamp') tetap bisa disimpan
+        legacy_dir = self.test_path / "legacy"
+        legacy_dir.mkdir()
+        (legacy_dir / "achievements.json").write_text(json.dumps({
+            "unlocked": {
+                "first_launch": {"unlocked_at": "2024-01-02T03:04:05"},
+                "into_portal": {}
+            },
+            "stats": {"orbs_destroyed": 7}
+        }))
+        with patch('services.achievement_system.AchievementManager._get_save_directory', return_value=legacy_dir):
+            migrated = AchievementManager()
+            self.assertTrue(migrated.is_unlocked("first_launch"))
+            self.assertTrue((legacy_dir / "achievements.bin").exists())
+            
+            reloaded = AchievementManager()
+            self.assertTrue(reloaded.is_unlocked("first_launch"))
+            self.assertTrue(reloaded.is_unlocked("into_portal"))
+            self.assertEqual(
+                reloaded.unlocked["first_launch"]["timestamp"],
+                datetime(2024, 1, 2, 3, 4, 5).timestamp()
+            )
+            self.assertEqual(reloaded.stats['orbs_destroyed'], 7)
 
     # ----------------------------------------------------------------
     # 5. TEST FILE UTILITIES (First Run)